@@ -0,0 +1,137 @@
+"""
+In-process caching
+Small TTL cache for read-heavy endpoints and a bounded LRU cache for lookups,
+both invalidated explicitly by write paths
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from app.config import settings
+from app.metrics import cache_evictions, cache_invalidations, cache_lookups
+
+
+class TTLCache:
+    """
+    Process-local cache whose entries expire after a fixed number of seconds.
+
+    Concurrent misses share a single load, so a burst of polling clients
+    costs one query when an entry expires.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = asyncio.Lock()
+        # Bumped on invalidation so loads that started before a write are not cached
+        self._generation = 0
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for key, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value for key for the cache TTL, dropping expired entries"""
+        now = time.monotonic()
+        # Keys that are never read again (e.g. superseded data versions) would otherwise pile up
+        for stale_key in [k for k, (expires_at, _) in self._entries.items() if expires_at < now]:
+            del self._entries[stale_key]
+        self._entries[key] = (now + self.ttl, value)
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for key, calling loader once on a miss"""
+        if self.ttl <= 0:
+            return await loader()
+
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        async with self._lock:
+            value = self.get(key)
+            if value is None:
+                generation = self._generation
+                value = await loader()
+                if generation == self._generation:
+                    self.set(key, value)
+        return value
+
+    def invalidate(self) -> None:
+        """Drop every entry; called after writes that change cached data"""
+        self._generation += 1
+        self._entries.clear()
+
+
+class LRUCache:
+    """
+    Process-local cache holding at most max_size entries.
+
+    The least recently used entry is evicted when the cache is full. Hits,
+    misses, evictions and invalidations are counted in the metrics under
+    the cache name, to help size it. A max_size of 0 disables caching.
+    """
+
+    def __init__(self, name: str, max_size: int):
+        self.name = name
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        # Bumped on invalidation so loads that started before a write are not cached
+        self.generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for key, or None if missing"""
+        value = self._entries.get(key)
+        if value is None:
+            cache_lookups.inc(self.name, "miss")
+            return None
+        self._entries.move_to_end(key)
+        cache_lookups.inc(self.name, "hit")
+        return value
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        """
+        Store value for key
+
+        Args:
+            key: Cache key
+            value: Value to store
+            generation: The generation read before value was loaded; the value
+                is dropped if the cache was invalidated since
+        """
+        if self.max_size <= 0 or (generation is not None and generation != self.generation):
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            cache_evictions.inc(self.name)
+
+    def discard(self, key: Hashable) -> None:
+        """Drop the entry for key, if any"""
+        self.generation += 1
+        self._entries.pop(key, None)
+
+    def invalidate(self) -> None:
+        """Drop every entry"""
+        self.generation += 1
+        self._entries.clear()
+        cache_invalidations.inc(self.name)
+
+
+# Dashboard stats are polled by every open browser tab
+dashboard_cache = TTLCache(ttl=settings.dashboard_cache_ttl)
+
+# employee_id -> directory entry, for existence checks (see EmployeeDirectory)
+employee_cache = LRUCache("employees", max_size=settings.employee_cache_size)
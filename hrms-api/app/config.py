@@ -4,7 +4,7 @@ Loads environment variables and provides configuration settings
 """
 
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Literal
 
 
 class Settings(BaseSettings):
@@ -14,6 +14,34 @@ class Settings(BaseSettings):
     mongodb_uri: str = "mongodb://localhost:27017"
     database_name: str = "hrms_db"
     
+    # Database TLS ("disable" for a local Postgres without SSL)
+    db_sslmode: Literal["disable", "prefer", "require", "verify-ca", "verify-full"] = "require"
+    
+    # Database connection pool
+    db_pool_mode: Literal["queue", "null"] = "queue"  # "null" for transaction-mode PgBouncer
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = False
+    db_liveness_interval: float = 30  # Seconds between background checks, 0 disables
+    parallel_read_timeout: float = 10  # Default per-query limit for parallel reads, 0 disables
+    
+    # Admission control: pooled connections API requests of each class may hold at once
+    # (0 disables), shared wait queue length and deadline, and Postgres statement_timeout
+    # per class (ms, 0 for no limit). The defaults leave DB_POOL_SIZE + DB_MAX_OVERFLOW
+    # room for the employee directory's LISTEN connection and batched attendance writes.
+    admission_read_limit: int = 8
+    admission_write_limit: int = 4
+    admission_queue_size: int = 50
+    admission_queue_timeout: float = 2.0
+    admission_retry_after: float = 1
+    read_statement_timeout_ms: int = 5000
+    write_statement_timeout_ms: int = 5000
+    
+    # Read replica (DATABASE_READ_URL): seconds a client's reads stay on the primary after it writes
+    read_your_writes_window: float = 5.0
+    
     # Server
     port: int = 8000
     environment: str = "development"
@@ -21,6 +49,27 @@ class Settings(BaseSettings):
     # CORS
     allowed_origins: str = "*"
     
+    # Caching (seconds, 0 disables)
+    dashboard_cache_ttl: float = 5.0
+    
+    # Employee directory cache (entries, 0 disables). Invalidated through LISTEN/NOTIFY,
+    # or by polling the employees change counter every poll_interval seconds behind PgBouncer
+    employee_cache_size: int = 10000
+    employee_cache_poll_interval: float = 5.0
+    
+    # Attendance write batching: concurrent marks are written together, up to
+    # this many per transaction (0 or 1 disables) after waiting at most max_wait_ms,
+    # with at most max_writes batches (pooled connections) being written at once
+    attendance_batch_max_size: int = 0
+    attendance_batch_max_wait_ms: float = 5
+    attendance_batch_max_writes: int = 2
+    
+    # Response compression (bodies smaller than this many bytes are sent as-is, 0 disables)
+    compression_minimum_size: int = 1024
+    
+    # Metrics (log statements slower than this, 0 disables)
+    slow_query_threshold_ms: float = 0
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -1,15 +1,122 @@
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import Session, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+import asyncio
+import logging
 import os
+import time
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Optional
 from dotenv import load_dotenv
 
+from app.config import settings
+from app.metrics import instrument_engine, pool_checkout_wait
+
+logger = logging.getLogger("database")
+
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL")
 
 Base = declarative_base()
 engine = None
 async_session_maker = None
+read_engine = None
+read_session_maker = None
+
+# Set by ReadYourWritesMiddleware when the client wrote within the last few seconds
+prefer_primary: ContextVar[bool] = ContextVar("prefer_primary", default=False)
+
+# Set by AdmissionControlMiddleware: statement_timeout for the current request
+# in milliseconds (0 for no limit), None outside requests (server default)
+statement_timeout_ms: ContextVar[Optional[int]] = ContextVar("statement_timeout_ms", default=None)
+
+# Session.info flag of read replica sessions
+REPLICA_KEY = "replica"
+
+
+class CheckoutTimingMixin:
+    """Records how long each checkout waits for a connection"""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_checkout_wait.observe(time.perf_counter() - start)
+
+
+class InstrumentedQueuePool(CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+class InstrumentedNullPool(CheckoutTimingMixin, NullPool):
+    pass
+
+
+def pool_options(driver_name: str) -> dict:
+    """
+    Engine keyword arguments for the configured pool mode
+
+    "queue" keeps a local pool of persistent connections. "null" opens a
+    connection per checkout, for use behind a transaction-mode PgBouncer,
+    which also means server-side prepared statements must be disabled.
+    """
+    if settings.db_pool_mode == "null":
+        if driver_name == "asyncpg":
+            connect_args = {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+        else:
+            connect_args = {"prepare_threshold": None}
+        return {"poolclass": InstrumentedNullPool, "connect_args": connect_args}
+
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,  # Recycle connections to avoid stale sessions
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "connect_args": {},
+    }
+
+
+def _set_default_statement_timeout(dbapi_connection, connection_record):
+    """
+    Give a new pooled connection the read statement_timeout as its default
+
+    Runs once per physical connection. The SET is committed (psycopg runs
+    it in an implicit transaction that a later rollback would undo) and only
+    recorded once it is durable.
+    """
+    timeout = settings.read_statement_timeout_ms
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"SET statement_timeout = {int(timeout)}")
+    cursor.close()
+    dbapi_connection.commit()
+    connection_record.info["statement_timeout_ms"] = timeout
+
+
+@event.listens_for(Session, "after_begin")
+def _apply_statement_timeout(session, transaction, connection):
+    """
+    Give a transaction the current request's statement_timeout
+
+    Nothing is sent when it matches the connection default (reads, and
+    writes unless WRITE_STATEMENT_TIMEOUT_MS differs); otherwise one SET
+    LOCAL, which ends with the transaction whether it commits or rolls back.
+    Connections without a default (DB_POOL_MODE=null) get the SET LOCAL in
+    every request transaction, which is safe through a transaction-mode
+    PgBouncer.
+    """
+    default = connection.info.get("statement_timeout_ms")
+    wanted = statement_timeout_ms.get()
+    if wanted == default:
+        return
+    value = "DEFAULT" if wanted is None else int(wanted)
+    connection.exec_driver_sql(f"SET LOCAL statement_timeout = {value}")
 
 
 class Database:
@@ -17,42 +124,19 @@ class Database:
     def __init__(self):
         self.engine = None
         self.session_maker = None
+        self._liveness_task = None
+        self.last_liveness_check = None
+        self.last_liveness_ok = None
 
     async def connect(self):
-        global engine, async_session_maker
+        global engine, async_session_maker, read_engine, read_session_maker
 
         if not DATABASE_URL:
             print("DATABASE_URL is not set in environment variables")
             return
 
         try:
-            # Determine which driver to use based on environment and availability
-            use_pooler = "pooler.supabase.com" in DATABASE_URL or "aws-1-ap-south-1" in DATABASE_URL
-
-            if use_pooler:
-                # Always use psycopg for pooler connections (more stable)
-                db_url = DATABASE_URL.replace("postgresql://", "postgresql+psycopg://")
-                driver_name = "psycopg"
-                connect_args = {"sslmode": "require"}
-            else:
-                # For direct connections, use asyncpg
-                db_url = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
-                driver_name = "asyncpg"
-                connect_args = {"ssl": "require"}
-
-            engine = create_async_engine(
-                db_url,
-                echo=os.getenv("ENVIRONMENT") == "development",
-                future=True,
-                # Add connection pooling and timeout settings for better cloud compatibility
-                pool_size=5,
-                max_overflow=10,
-                pool_timeout=30,
-                pool_recycle=1800,  # Recyle connections faster to avoid stale sessions
-                pool_pre_ping=True, # Test connections before use to recover from server disconnects
-                connect_args=connect_args,
-            )
-
+            engine, driver_name, use_pooler = self._create_engine(DATABASE_URL)
             async_session_maker = async_sessionmaker(
                 engine,
                 class_=AsyncSession,
@@ -61,18 +145,144 @@ class Database:
 
             print(f"PostgreSQL connected successfully using {driver_name}")
             print(f"Using database: {'Pooler (Production)' if use_pooler else 'Direct (Development)'}")
+            print(f"Connection pool mode: {settings.db_pool_mode}")
+
+            if DATABASE_READ_URL:
+                # The replica gets its own pool so reads never wait behind writes
+                read_engine, driver_name, _ = self._create_engine(DATABASE_READ_URL)
+                read_session_maker = async_sessionmaker(
+                    read_engine,
+                    class_=AsyncSession,
+                    expire_on_commit=False,
+                    info={REPLICA_KEY: True}
+                )
+                print(f"Read replica connected successfully using {driver_name}")
+
+            if settings.db_pool_mode == "queue" and settings.db_liveness_interval > 0:
+                self._liveness_task = asyncio.create_task(self._liveness_loop())
         except Exception as e:
             print(f"Failed to connect to PostgreSQL: {e}")
             raise e
 
+    def _create_engine(self, url: str):
+        """
+        Create an instrumented engine for a database URL
+
+        Returns:
+            Tuple of (engine, driver name, whether the URL is a Supabase pooler)
+        """
+        # Determine which driver to use based on environment and availability
+        use_pooler = "pooler.supabase.com" in url or "aws-1-ap-south-1" in url
+
+        if use_pooler:
+            # Always use psycopg for pooler connections (more stable)
+            db_url = url.replace("postgresql://", "postgresql+psycopg://")
+            driver_name = "psycopg"
+            connect_args = {"sslmode": settings.db_sslmode}
+        else:
+            # For direct connections, use asyncpg
+            db_url = url.replace("postgresql://", "postgresql+asyncpg://")
+            driver_name = "asyncpg"
+            connect_args = {"ssl": settings.db_sslmode}
+
+        options = pool_options(driver_name)
+        connect_args.update(options.pop("connect_args"))
+
+        new_engine = create_async_engine(
+            db_url,
+            echo=os.getenv("ENVIRONMENT") == "development",
+            future=True,
+            connect_args=connect_args,
+            **options,
+        )
+        instrument_engine(new_engine.sync_engine)
+        if settings.db_pool_mode == "queue":
+            # Session settings would leak to other clients through a transaction-mode PgBouncer
+            event.listen(new_engine.sync_engine, "connect", _set_default_statement_timeout)
+        return new_engine, driver_name, use_pooler
+
+    async def _liveness_loop(self):
+        """
+        Periodically check that the database is reachable
+
+        Replaces pool_pre_ping, which costs a round trip on every checkout.
+        When the check fails (server restart, failover) the idle connections
+        are discarded so the next checkouts open fresh ones.
+        """
+        while True:
+            await asyncio.sleep(settings.db_liveness_interval)
+            self.last_liveness_check = datetime.utcnow()
+            self.last_liveness_ok = True
+            for checked_engine in (engine, read_engine):
+                if checked_engine is None:
+                    continue
+                try:
+                    async with checked_engine.connect() as conn:
+                        await conn.execute(text("SELECT 1"))
+                except Exception as e:
+                    self.last_liveness_ok = False
+                    logger.warning(f"Database liveness check failed, recycling pool: {e}")
+                    await checked_engine.dispose()
+
     async def disconnect(self):
         global engine
+        if self._liveness_task:
+            self._liveness_task.cancel()
+            self._liveness_task = None
+        if read_engine:
+            await read_engine.dispose()
         if engine:
             await engine.dispose()
             print("PostgreSQL disconnected")
 
+    def pool_stats(self, replica: bool = False) -> Optional[dict]:
+        """
+        Current connection pool usage
+
+        Args:
+            replica: Report the read replica pool instead of the primary
+
+        Returns:
+            Pool statistics, or None for the replica when none is configured
+        """
+        pool_engine = read_engine if replica else engine
+        if replica and pool_engine is None:
+            return None
+
+        stats = {
+            "mode": settings.db_pool_mode,
+            "lastLivenessCheck": self.last_liveness_check,
+            "lastLivenessOk": self.last_liveness_ok,
+        }
+        if pool_engine is not None and isinstance(pool_engine.pool, AsyncAdaptedQueuePool):
+            pool = pool_engine.pool
+            stats.update({
+                "size": pool.size(),
+                "maxOverflow": settings.db_max_overflow,
+                "checkedOut": pool.checkedout(),
+                "idle": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+            })
+        return stats
+
     def get_session(self):
         return async_session_maker()
 
+    def get_read_session(self):
+        """
+        Session for read-only queries that tolerate replica lag
+
+        Uses the read replica when DATABASE_READ_URL is set, unless the
+        current client wrote recently (see ReadYourWritesMiddleware), in
+        which case the primary is used so the client sees its own writes.
+        """
+        if read_session_maker is None or prefer_primary.get():
+            return async_session_maker()
+        return read_session_maker()
+
+    def is_replica(self, session) -> bool:
+        """Whether session reads from the replica (and may lag behind the primary)"""
+        return session.info.get(REPLICA_KEY, False)
+
 
 db = Database()
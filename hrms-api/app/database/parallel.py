@@ -0,0 +1,115 @@
+"""
+Parallel reads
+Runs independent read queries of one request concurrently, each on its own
+pooled session, so composite endpoints wait for the slowest query instead of
+the sum of all of them
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Executable
+
+from app.config import settings
+from app.database.connection import db
+from app.metrics import parallel_read_fallbacks
+
+logger = logging.getLogger("database")
+
+# Marks an optional read that fell back
+_FAILED = object()
+
+
+@dataclass
+class ParallelRead:
+    """
+    One independent read for run_parallel_reads
+
+    Attributes:
+        load: Runs the query on the given session and returns its result
+        timeout: Seconds before giving up (PARALLEL_READ_TIMEOUT when None, 0 for no limit)
+        required: Whether a failure fails the whole call; otherwise fallback is used
+        fallback: Result used when an optional read fails or times out
+    """
+    load: Callable[[AsyncSession], Awaitable[Any]]
+    timeout: Optional[float] = None
+    required: bool = True
+    fallback: Any = None
+
+
+@dataclass
+class ParallelReadResult:
+    """Results by name, and the names of optional reads that fell back"""
+    values: Dict[str, Any]
+    failed: List[str]
+
+    @property
+    def partial(self) -> bool:
+        return bool(self.failed)
+
+
+def fetch_all(statement: Executable) -> Callable[[AsyncSession], Awaitable[list]]:
+    """ParallelRead loader returning every row of a statement"""
+    async def load(session: AsyncSession) -> list:
+        return (await session.execute(statement)).all()
+    return load
+
+
+async def run_parallel_reads(reads: Dict[str, ParallelRead]) -> ParallelReadResult:
+    """
+    Run independent reads concurrently on separate read sessions
+
+    Every read checks out its own connection (from the read replica when one
+    is configured), so a call holds up to len(reads) connections at once;
+    keep DB_POOL_SIZE above the number of concurrent composite requests
+    times the reads per request.
+
+    Args:
+        reads: Reads by name
+
+    Returns:
+        Results by name; failed optional reads hold their fallback
+
+    Raises:
+        asyncio.TimeoutError: If a required read timed out
+        Exception: Whatever a required read raised; the other reads are cancelled
+    """
+    async def run(name: str, read: ParallelRead):
+        timeout = settings.parallel_read_timeout if read.timeout is None else read.timeout
+
+        async def load():
+            async with db.get_read_session() as session:
+                return await read.load(session)
+
+        try:
+            return await asyncio.wait_for(load(), timeout or None)
+        except Exception as e:
+            if read.required:
+                raise
+            parallel_read_fallbacks.inc(name)
+            logger.warning(f"Parallel read {name!r} failed, using fallback: {e!r}")
+            return _FAILED
+
+    names = list(reads)
+    tasks = [asyncio.ensure_future(run(name, reads[name])) for name in names]
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        # Let cancelled reads return their connections before failing
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    values = {}
+    failed = []
+    for name, result in zip(names, results):
+        if result is _FAILED:
+            failed.append(name)
+            values[name] = reads[name].fallback
+        else:
+            values[name] = result
+    return ParallelReadResult(values=values, failed=failed)
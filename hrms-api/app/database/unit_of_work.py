@@ -0,0 +1,68 @@
+"""
+Unit of work
+One session per request (or background job), committed or rolled back once
+at the end, with callbacks for work that must only happen after the commit
+"""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.connection import db
+
+AFTER_COMMIT_KEY = "after_commit"
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """
+    Run callback once the unit of work that owns session has committed
+
+    Used for cache invalidation, so a concurrent reader cannot reload and
+    cache data the transaction has not committed yet. Dropped on rollback.
+    """
+    session.info.setdefault(AFTER_COMMIT_KEY, []).append(callback)
+
+
+@asynccontextmanager
+async def unit_of_work(read_only: bool = False) -> AsyncIterator[AsyncSession]:
+    """
+    Provide a session for one unit of work
+
+    The session checks out a connection only when the first statement runs,
+    so code paths that never reach the database cost nothing, and every
+    statement of the unit of work shares that one connection and transaction.
+
+    Args:
+        read_only: Use the read session (the replica when configured) and
+            never commit; the connection is returned as soon as the block exits
+
+    Yields:
+        The session. Committed when the block exits normally (and anything
+        ran), rolled back when it raises.
+    """
+    session = db.get_read_session() if read_only else db.get_session()
+    try:
+        yield session
+        if not read_only and session.in_transaction():
+            await session.commit()
+            for callback in session.info.pop(AFTER_COMMIT_KEY, []):
+                callback()
+    except BaseException:
+        if session.in_transaction():
+            await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
+async def get_session() -> AsyncIterator[AsyncSession]:
+    """FastAPI dependency: the request's primary session, committed after the route returns"""
+    async with unit_of_work() as session:
+        yield session
+
+
+async def get_read_session() -> AsyncIterator[AsyncSession]:
+    """FastAPI dependency: the request's read session, released after the route returns"""
+    async with unit_of_work(read_only=True) as session:
+        yield session
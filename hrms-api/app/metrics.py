@@ -0,0 +1,228 @@
+"""
+Application metrics
+Collects request, database and pool timings and renders them in the
+Prometheus text exposition format
+"""
+
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+
+logger = logging.getLogger("metrics")
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+BATCH_SIZE_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500)
+
+LabelValues = Tuple[str, ...]
+
+
+class Counter:
+    """Monotonic counter with optional labels"""
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labels = tuple(labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        for label_values, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labels, label_values)} {value}")
+        return "\n".join(lines)
+
+
+class Histogram:
+    """Cumulative histogram with fixed buckets and optional labels"""
+
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float], labels: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(buckets)
+        self.labels = tuple(labels)
+        # label values -> (per-bucket counts, sum, count)
+        self._series: Dict[LabelValues, Tuple[list, float, int]] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        counts, total, count = self._series.get(label_values) or ([0] * len(self.buckets), 0.0, 0)
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[index] += 1
+                break
+        self._series[label_values] = (counts, total + value, count + 1)
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for label_values, (counts, total, count) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.labels + ("le",), label_values + (_format_bound(bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labels + ("le",), label_values + ("+Inf",))
+            lines.append(f"{self.name}_bucket{labels} {count}")
+            labels = _format_labels(self.labels, label_values)
+            lines.append(f"{self.name}_sum{labels} {total}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return "\n".join(lines)
+
+
+def _format_bound(bound: float) -> str:
+    return str(int(bound)) if float(bound).is_integer() else str(bound)
+
+
+def _format_labels(names: Tuple[str, ...], values: LabelValues) -> str:
+    if not names:
+        return ""
+    escaped = (
+        str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        for value in values
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in zip(names, escaped)) + "}"
+
+
+@dataclass
+class RequestStats:
+    """Database work done while handling one request"""
+    queries: int = 0
+    query_seconds: float = 0.0
+    checkouts: int = 0
+
+
+# Set by MetricsMiddleware for the duration of each HTTP request
+current_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("current_request_stats", default=None)
+
+
+http_requests = Counter(
+    "hrms_http_requests_total", "HTTP requests handled", ("method", "route", "status")
+)
+http_latency = Histogram(
+    "hrms_http_request_duration_seconds", "HTTP request latency", LATENCY_BUCKETS, ("method", "route")
+)
+request_db_queries = Histogram(
+    "hrms_http_request_db_queries", "Database queries per HTTP request", QUERY_COUNT_BUCKETS, ("method", "route")
+)
+request_db_checkouts = Histogram(
+    "hrms_http_request_db_checkouts", "Pooled connections checked out per HTTP request", QUERY_COUNT_BUCKETS, ("method", "route")
+)
+request_db_seconds = Histogram(
+    "hrms_http_request_db_seconds", "Database time per HTTP request", LATENCY_BUCKETS, ("method", "route")
+)
+db_query_latency = Histogram(
+    "hrms_db_query_duration_seconds", "Database statement latency", LATENCY_BUCKETS
+)
+db_slow_queries = Counter(
+    "hrms_db_slow_queries_total", "Database statements slower than SLOW_QUERY_THRESHOLD_MS"
+)
+pool_checkout_wait = Histogram(
+    "hrms_db_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection", LATENCY_BUCKETS
+)
+admission_rejected = Counter(
+    "hrms_admission_rejected_total", "Requests rejected with 503 by admission control", ("class", "reason")
+)
+admission_wait = Histogram(
+    "hrms_admission_wait_seconds", "Time queued requests waited for an admission slot", LATENCY_BUCKETS, ("class",)
+)
+parallel_read_fallbacks = Counter(
+    "hrms_db_parallel_read_fallbacks_total", "Optional parallel reads that failed or timed out", ("read",)
+)
+cache_lookups = Counter(
+    "hrms_cache_lookups_total", "In-process cache lookups", ("cache", "result")
+)
+cache_evictions = Counter(
+    "hrms_cache_evictions_total", "Entries evicted from full in-process caches", ("cache",)
+)
+cache_invalidations = Counter(
+    "hrms_cache_invalidations_total", "Times an in-process cache was cleared", ("cache",)
+)
+attendance_batch_size = Histogram(
+    "hrms_attendance_batch_size", "Attendance marks written per batch", BATCH_SIZE_BUCKETS
+)
+
+REGISTRY = (
+    http_requests,
+    http_latency,
+    request_db_queries,
+    request_db_seconds,
+    request_db_checkouts,
+    db_query_latency,
+    db_slow_queries,
+    pool_checkout_wait,
+    attendance_batch_size,
+    cache_lookups,
+    cache_evictions,
+    cache_invalidations,
+    parallel_read_fallbacks,
+    admission_rejected,
+    admission_wait,
+)
+
+
+def observe_request(method: str, route: str, status: int, seconds: float, stats: RequestStats) -> None:
+    """Record one finished HTTP request"""
+    http_requests.inc(method, route, str(status))
+    http_latency.observe(seconds, method, route)
+    request_db_queries.observe(stats.queries, method, route)
+    request_db_seconds.observe(stats.query_seconds, method, route)
+    request_db_checkouts.observe(stats.checkouts, method, route)
+
+
+def render() -> str:
+    """Render every metric in the Prometheus text format"""
+    return "\n".join(metric.render() for metric in REGISTRY) + "\n"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _record_query(conn, statement) -> None:
+    elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+    db_query_latency.observe(elapsed)
+
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.query_seconds += elapsed
+
+    threshold = settings.slow_query_threshold_ms
+    if threshold and elapsed * 1000 >= threshold:
+        db_slow_queries.inc()
+        logger.warning(f"Slow query ({elapsed * 1000:.1f} ms): {statement}")
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    _record_query(conn, statement)
+
+
+def _handle_error(exception_context):
+    # after_cursor_execute does not run for failed statements (e.g. a
+    # unique violation or a statement timeout), so they are counted here
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start_time"):
+        _record_query(conn, exception_context.statement)
+
+
+def _checkout(dbapi_connection, connection_record, connection_proxy):
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.checkouts += 1
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attach query timing and connection checkout listeners to a (sync) engine"""
+    event.listen(engine, "checkout", _checkout)
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
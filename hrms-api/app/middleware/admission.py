@@ -0,0 +1,212 @@
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app import metrics
+from app.config import settings
+from app.database import connection
+from app.services.attendance_batcher import attendance_batcher
+
+logger = logging.getLogger(__name__)
+
+READ_METHODS = {"GET", "HEAD"}
+# Monitoring must keep answering while the API is saturated
+EXEMPT_PATHS = {"/api/health", "/api/metrics"}
+# Routes whose statements legitimately run longer than their class limit (0: no limit)
+STATEMENT_TIMEOUT_OVERRIDES_MS = {
+    ("GET", "/api/attendance/export"): 0,
+    ("POST", "/api/attendance/bulk"): 60000,
+}
+# Routes that hold more than one pooled connection at once
+ROUTE_CONNECTIONS = {
+    ("GET", "/api/dashboard/departments"): 2,  # totals and absentees read in parallel
+}
+
+
+class AdmissionGate:
+    """
+    Connection limit with a bounded FIFO wait queue.
+
+    Admitted requests hold at most `limit` pooled connections between them;
+    a request takes as many slots as connections it uses at once. Up to
+    `queue_size` more requests wait for slots for at most `max_wait`
+    seconds; anything beyond that is rejected immediately, so a spike is
+    shed at the door instead of piling up in the connection pool.
+    """
+
+    def __init__(self, name: str, limit: int, queue_size: int, max_wait: float):
+        self.name = name
+        self.limit = limit
+        self.queue_size = queue_size
+        self.max_wait = max_wait
+        self.active = 0
+        self._waiters: Deque[Tuple[asyncio.Future, int]] = deque()
+
+    async def acquire(self, slots: int = 1) -> Optional[str]:
+        """
+        Take slots, waiting in the queue if needed
+
+        Args:
+            slots: Connections the request holds at once (capped at the limit)
+
+        Returns:
+            None when admitted, otherwise the rejection reason
+            ("queue_full" or "timeout")
+        """
+        slots = min(slots, self.limit)
+        if self.active + slots <= self.limit and not self._waiters:
+            self.active += slots
+            return None
+        if len(self._waiters) >= self.queue_size:
+            return "queue_full"
+
+        waiter = asyncio.get_running_loop().create_future()
+        entry = (waiter, slots)
+        self._waiters.append(entry)
+        start = time.perf_counter()
+        try:
+            # release() hands the slots straight to the waiter
+            await asyncio.wait_for(waiter, self.max_wait)
+            return None
+        except asyncio.TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                # Handed slots just as the deadline passed
+                self.release(slots)
+            return "timeout"
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release(slots)
+            raise
+        finally:
+            metrics.admission_wait.observe(time.perf_counter() - start, self.name)
+            if not waiter.done() or waiter.cancelled():
+                try:
+                    self._waiters.remove(entry)
+                except ValueError:
+                    pass
+                # A large waiter leaving may unblock smaller ones behind it
+                self._admit_waiters()
+
+    def release(self, slots: int = 1) -> None:
+        """Free slots and pass them to the oldest waiters that fit"""
+        self.active -= min(slots, self.limit)
+        self._admit_waiters()
+
+    def _admit_waiters(self) -> None:
+        # Strict FIFO, so a request needing several slots is not starved
+        while self._waiters:
+            waiter, slots = self._waiters[0]
+            if waiter.done():
+                self._waiters.popleft()
+                continue
+            if self.active + slots > self.limit:
+                return
+            self._waiters.popleft()
+            self.active += slots
+            waiter.set_result(None)
+
+
+class AdmissionControlMiddleware:
+    """
+    Middleware that limits how many pooled connections API requests hold at once.
+
+    Reads (GET, HEAD) and writes have separate limits and wait queues, so a
+    burst of one cannot starve the other. Routes listed in ROUTE_CONNECTIONS
+    count as several connections. A request that finds the queue
+    full, or waits longer than ADMISSION_QUEUE_TIMEOUT, gets an immediate
+    503 with Retry-After instead of waiting out the pool timeout. Admitted
+    requests run with the Postgres statement_timeout of their class (see
+    STATEMENT_TIMEOUT_OVERRIDES_MS for exceptions), so a slow query cannot
+    hold its connection indefinitely.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.gates = {
+            "read": AdmissionGate(
+                "read",
+                settings.admission_read_limit,
+                settings.admission_queue_size,
+                settings.admission_queue_timeout
+            ),
+            "write": AdmissionGate(
+                "write",
+                settings.admission_write_limit,
+                settings.admission_queue_size,
+                settings.admission_queue_timeout
+            ),
+        }
+        self._check_pool_headroom()
+
+    def _check_pool_headroom(self) -> None:
+        """Warn when admitted requests alone could exhaust the connection pool"""
+        if settings.db_pool_mode != "queue" or settings.admission_read_limit <= 0 or settings.admission_write_limit <= 0:
+            return
+        # Connections held outside the gates: the employee directory's LISTEN
+        # connection and batched attendance writes (which bypass the write gate)
+        reserved = 1 if settings.employee_cache_size > 0 else 0
+        if attendance_batcher.enabled:
+            reserved += attendance_batcher.max_writes
+        capacity = settings.db_pool_size + settings.db_max_overflow
+        needed = settings.admission_read_limit + settings.admission_write_limit + reserved
+        if needed > capacity:
+            logger.warning(
+                f"Admission limits ({settings.admission_read_limit} read + {settings.admission_write_limit} write) "
+                f"plus {reserved} reserved connections exceed the pool ({capacity}); "
+                f"a spike can still exhaust it"
+            )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        path = scope.get("path", "")
+        if (
+            scope["type"] != "http"
+            or scope["method"] == "OPTIONS"
+            or not path.startswith("/api/")
+            or path in EXEMPT_PATHS
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        route_class = "read" if method in READ_METHODS else "write"
+        timeout_ms = STATEMENT_TIMEOUT_OVERRIDES_MS.get(
+            (method, path),
+            settings.read_statement_timeout_ms if route_class == "read" else settings.write_statement_timeout_ms
+        )
+        token = connection.statement_timeout_ms.set(timeout_ms)
+
+        try:
+            # Batched marks share a few connections, so they must not be capped at the write limit
+            if method == "POST" and path == "/api/attendance" and attendance_batcher.enabled:
+                await self.app(scope, receive, send)
+                return
+
+            gate = self.gates[route_class]
+            if gate.limit <= 0:
+                await self.app(scope, receive, send)
+                return
+
+            slots = ROUTE_CONNECTIONS.get((method, path), 1)
+            rejection = await gate.acquire(slots)
+            if rejection is not None:
+                metrics.admission_rejected.inc(route_class, rejection)
+                response = JSONResponse(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    content={"detail": "Server is busy, please retry shortly"},
+                    headers={"Retry-After": str(math.ceil(settings.admission_retry_after))}
+                )
+                await response(scope, receive, send)
+                return
+
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                gate.release(slots)
+        finally:
+            connection.statement_timeout_ms.reset(token)
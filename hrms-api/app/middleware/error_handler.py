@@ -1,24 +1,62 @@
+import math
 import os
 import traceback
-from fastapi import Request, status
+from fastapi import status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import logging
 
+from app.config import settings
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("error_handler")
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
+QUERY_CANCELED = "57014"  # Raised by statement_timeout
+
+class ErrorHandlerMiddleware:
     """
     Middleware to catch all unhandled exceptions and return a 
     consistent JSON response.
+
+    Implemented as plain ASGI (not BaseHTTPMiddleware) so requests run in
+    the caller's task and streaming responses pass through untouched.
     """
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
         try:
-            return await call_next(request)
+            await self.app(scope, receive, send_wrapper)
         except Exception as exc:
+            trace = traceback.format_exc()
             logger.error(f"Unhandled Exception: {str(exc)}")
-            logger.error(traceback.format_exc())
+            logger.error(trace)
+
+            # Headers are already on the wire; let the server close the connection
+            if response_started:
+                raise
+
+            if getattr(getattr(exc, "orig", None), "sqlstate", None) == QUERY_CANCELED:
+                # statement_timeout hit: the database is overloaded, not the request malformed
+                response = JSONResponse(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    content={"success": False, "message": "The request took too long, please retry."},
+                    headers={"Retry-After": str(math.ceil(settings.admission_retry_after))}
+                )
+                await response(scope, receive, send)
+                return
 
             is_dev = os.getenv("ENVIRONMENT") == "development"
 
@@ -31,9 +69,10 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
 
             if is_dev:
                 content["detail"] = str(exc)
-                content["trace"] = traceback.format_exc().splitlines()
+                content["trace"] = trace.splitlines()
 
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 content=content
             )
+            await response(scope, receive, send)
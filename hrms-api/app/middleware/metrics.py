@@ -0,0 +1,45 @@
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app import metrics
+
+
+class MetricsMiddleware:
+    """
+    Middleware that records latency and database usage for every request.
+
+    Requests are labelled with the matched route template (e.g.
+    /api/employees/{employee_id}) so that path parameters do not explode
+    the number of series.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = metrics.RequestStats()
+        token = metrics.current_request_stats.set(stats)
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            metrics.current_request_stats.reset(token)
+            route = scope.get("route")
+            metrics.observe_request(
+                scope["method"],
+                route.path if route is not None else "unmatched",
+                status_code,
+                time.perf_counter() - start,
+                stats
+            )
@@ -0,0 +1,55 @@
+import math
+from http.cookies import SimpleCookie
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+from app.database import connection
+
+COOKIE_NAME = "hrms_recent_write"
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+class ReadYourWritesMiddleware:
+    """
+    Middleware that pins a client's reads to the primary right after it writes.
+
+    A successful write sets a short-lived cookie. While the cookie is present,
+    get_read_session() returns a primary session, so the client does not read
+    a replica that has not replayed its write yet. Other clients keep reading
+    from the replica. Does nothing when no read replica is configured.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if (
+            scope["type"] != "http"
+            or not connection.DATABASE_READ_URL
+            or settings.read_your_writes_window <= 0
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        cookies = SimpleCookie(headers.get("cookie", ""))
+        token = connection.prefer_primary.set(COOKIE_NAME in cookies)
+        is_write = scope["method"] in WRITE_METHODS
+
+        async def send_wrapper(message: Message):
+            if is_write and message["type"] == "http.response.start" and message["status"] < 400:
+                MutableHeaders(scope=message).append("set-cookie", self._cookie(headers))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            connection.prefer_primary.reset(token)
+
+    def _cookie(self, request_headers: Headers) -> str:
+        max_age = math.ceil(settings.read_your_writes_window)
+        cookie = f"{COOKIE_NAME}=1; Max-Age={max_age}; Path=/; HttpOnly"
+        # The UI is usually served from another site, which needs SameSite=None (HTTPS only)
+        if request_headers.get("x-forwarded-proto", "").startswith("https"):
+            return cookie + "; SameSite=None; Secure"
+        return cookie + "; SameSite=Lax"
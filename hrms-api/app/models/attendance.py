@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Literal
+from typing import List, Literal, Optional
 from datetime import date as DateType, datetime
 
 
@@ -29,3 +29,111 @@ class AttendanceResponse(AttendanceBase):
                 "createdAt": "2026-02-01T10:35:00Z"
             }
         }
+
+
+class AttendanceListResponse(BaseModel):
+    """Schema for a page of an employee's attendance records"""
+    items: List[AttendanceResponse] = Field(..., description="Records on this page, most recent date first")
+    nextCursor: Optional[DateType] = Field(None, description="Cursor for the next (older) page, null on the last page")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "items": [
+                    {
+                        "id": "507f1f77bcf86cd799439012",
+                        "employeeId": "EMP001",
+                        "date": "2026-02-01",
+                        "status": "Present",
+                        "createdAt": "2026-02-01T10:35:00Z"
+                    }
+                ],
+                "nextCursor": "2026-02-01"
+            }
+        }
+
+
+class AttendanceBulkCreate(BaseModel):
+    """Schema for marking attendance for many employees in one request"""
+    records: List[AttendanceCreate] = Field(
+        ...,
+        min_length=1,
+        max_length=5000,
+        description="Attendance records to mark (at most 5000 per request)"
+    )
+
+
+class AttendanceBulkResult(BaseModel):
+    """Outcome of a single record in a bulk attendance request"""
+    index: int = Field(..., description="Position of the record in the request")
+    employeeId: str = Field(..., description="Employee identifier")
+    date: DateType = Field(..., description="Attendance date")
+    outcome: Literal["created", "duplicate", "employee_not_found", "future_date"] = Field(
+        ..., description="What happened to this record"
+    )
+    id: Optional[str] = Field(None, description="Database ID (only for created records)")
+    createdAt: Optional[datetime] = Field(None, description="Creation timestamp (only for created records)")
+
+
+class AttendanceBulkResponse(BaseModel):
+    """Schema for bulk attendance response"""
+    created: int = Field(..., description="Number of records inserted")
+    skipped: int = Field(..., description="Number of records not inserted")
+    results: List[AttendanceBulkResult] = Field(..., description="Per-record outcomes in request order")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "created": 1,
+                "skipped": 1,
+                "results": [
+                    {
+                        "index": 0,
+                        "employeeId": "EMP001",
+                        "date": "2026-02-01",
+                        "outcome": "created",
+                        "id": "507f1f77bcf86cd799439012",
+                        "createdAt": "2026-02-01T10:35:00Z"
+                    },
+                    {
+                        "index": 1,
+                        "employeeId": "EMP999",
+                        "date": "2026-02-01",
+                        "outcome": "employee_not_found",
+                        "id": None,
+                        "createdAt": None
+                    }
+                ]
+            }
+        }
+
+
+class AttendanceMatrixRow(BaseModel):
+    """One employee's attendance for a month"""
+    employeeId: str = Field(..., description="Employee identifier")
+    fullName: str = Field(..., description="Employee full name")
+    department: str = Field(..., description="Department name")
+    days: str = Field(..., description="One character per day of the month: P = Present, A = Absent, - = unmarked")
+
+
+class AttendanceMatrixResponse(BaseModel):
+    """Schema for the monthly attendance matrix"""
+    month: str = Field(..., description="Month in YYYY-MM format")
+    daysInMonth: int = Field(..., description="Number of days (length of each row's days string)")
+    employees: List[AttendanceMatrixRow] = Field(..., description="Rows ordered by employee ID")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "month": "2026-02",
+                "daysInMonth": 28,
+                "employees": [
+                    {
+                        "employeeId": "EMP001",
+                        "fullName": "John Doe",
+                        "department": "Engineering",
+                        "days": "PPAPP--PPPPP--PPPPP--PPPPP--"
+                    }
+                ]
+            }
+        }
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Date, DateTime, func, ForeignKey, UniqueConstraint, Enum
+from sqlalchemy import Column, String, Date, DateTime, func, ForeignKey, UniqueConstraint, Enum, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -15,12 +15,21 @@ class Attendance(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     employee_id = Column(String(50), ForeignKey("employees.employee_id", ondelete="CASCADE"), nullable=False, index=True)
     date = Column(Date, nullable=False, index=True)
-    status = Column(Enum(AttendanceStatus), nullable=False)
+    # Type name as created by hrms-db/schema.sql
+    status = Column(Enum(AttendanceStatus, name="attendance_status"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Client-supplied Idempotency-Key of the request that created the record
+    idempotency_key = Column(String(255), nullable=True)
 
-    # Unique constraint for employee_id + date
+    # Unique constraint for employee_id + date, and one record per idempotency key
     __table_args__ = (
         UniqueConstraint('employee_id', 'date', name='uix_employee_date'),
+        Index(
+            'uix_attendance_idempotency_key',
+            'idempotency_key',
+            unique=True,
+            postgresql_where=idempotency_key.isnot(None)
+        ),
     )
 
     # Relationship to Employee
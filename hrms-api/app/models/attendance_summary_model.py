@@ -0,0 +1,17 @@
+from sqlalchemy import Column, String, Integer, BigInteger, ForeignKey
+from app.database.connection import Base
+
+class AttendanceSummary(Base):
+    """
+    Per-employee attendance counters.
+
+    Maintained by triggers on the attendance table (see hrms-db/schema.sql),
+    so it is only ever read from the application.
+    """
+    __tablename__ = "attendance_summary"
+
+    employee_id = Column(String(50), ForeignKey("employees.employee_id", ondelete="CASCADE"), primary_key=True)
+    present_count = Column(Integer, nullable=False, default=0)
+    absent_count = Column(Integer, nullable=False, default=0)
+    # Bumped on every change to the employee's attendance
+    version = Column(BigInteger, nullable=False, default=0)
@@ -1,17 +1,42 @@
 from pydantic import BaseModel
 from datetime import datetime
+from typing import Optional
+
+
+class PoolStats(BaseModel):
+    """Schema for database connection pool statistics"""
+    mode: str
+    size: Optional[int] = None
+    maxOverflow: Optional[int] = None
+    checkedOut: Optional[int] = None
+    idle: Optional[int] = None
+    overflow: Optional[int] = None
+    lastLivenessCheck: Optional[datetime] = None
+    lastLivenessOk: Optional[bool] = None
 
 
 class HealthResponse(BaseModel):
     """Schema for health check response"""
     status: str
     timestamp: datetime
+    database: Optional[PoolStats] = None
+    readReplica: Optional[PoolStats] = None
 
     class Config:
         json_schema_extra = {
             "example": {
                 "status": "healthy",
-                "timestamp": "2026-02-01T10:40:00Z"
+                "timestamp": "2026-02-01T10:40:00Z",
+                "database": {
+                    "mode": "queue",
+                    "size": 5,
+                    "maxOverflow": 10,
+                    "checkedOut": 1,
+                    "idle": 4,
+                    "overflow": 0,
+                    "lastLivenessCheck": "2026-02-01T10:39:45Z",
+                    "lastLivenessOk": True
+                }
             }
         }
 
@@ -0,0 +1,61 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import date as DateType
+
+
+class DepartmentWeek(BaseModel):
+    """Attendance counts for one department in one week"""
+    weekStart: DateType = Field(..., description="Monday of the week")
+    present: int = Field(..., description="Records marked Present")
+    absent: int = Field(..., description="Records marked Absent")
+    absenceRate: Optional[float] = Field(None, description="absent / (present + absent), null without records")
+
+
+class DepartmentAbsentee(BaseModel):
+    """An employee with absences in the period"""
+    employeeId: str = Field(..., description="Employee identifier")
+    fullName: str = Field(..., description="Employee full name")
+    absentDays: int = Field(..., description="Days marked Absent in the period")
+
+
+class DepartmentStats(BaseModel):
+    """Attendance analytics for one department"""
+    department: str = Field(..., description="Department name")
+    headcount: int = Field(..., description="Current number of employees")
+    present: int = Field(..., description="Records marked Present in the period")
+    absent: int = Field(..., description="Records marked Absent in the period")
+    attendanceRate: Optional[float] = Field(None, description="present / (present + absent), null without records")
+    weeklyTrend: List[DepartmentWeek] = Field(..., description="Every week overlapping the period, oldest first")
+    topAbsentees: List[DepartmentAbsentee] = Field(..., description="Employees with the most absences, most first")
+
+
+class DepartmentAnalyticsResponse(BaseModel):
+    """Schema for per-department attendance analytics"""
+    dateFrom: DateType = Field(..., description="First day of the period")
+    dateTo: DateType = Field(..., description="Last day of the period")
+    departments: List[DepartmentStats] = Field(..., description="Departments ordered by name")
+    partial: bool = Field(False, description="True when top absentees could not be loaded in time and are left empty")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "dateFrom": "2026-01-05",
+                "dateTo": "2026-02-01",
+                "departments": [
+                    {
+                        "department": "Engineering",
+                        "headcount": 12,
+                        "present": 214,
+                        "absent": 26,
+                        "attendanceRate": 0.8917,
+                        "weeklyTrend": [
+                            {"weekStart": "2026-01-05", "present": 54, "absent": 6, "absenceRate": 0.1}
+                        ],
+                        "topAbsentees": [
+                            {"employeeId": "EMP004", "fullName": "Jane Smith", "absentDays": 5}
+                        ]
+                    }
+                ],
+                "partial": False
+            }
+        }
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -37,6 +37,30 @@ class EmployeeResponse(EmployeeBase):
         }
 
 
+class EmployeeListResponse(BaseModel):
+    """Schema for a page of employees"""
+    items: List[EmployeeResponse] = Field(..., description="Employees on this page, ordered by employee ID")
+    nextCursor: Optional[str] = Field(None, description="Cursor for the next page (null on the last page)")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "items": [
+                    {
+                        "id": "507f1f77bcf86cd799439011",
+                        "employeeId": "EMP001",
+                        "fullName": "John Doe",
+                        "email": "john.doe@company.com",
+                        "department": "Engineering",
+                        "createdAt": "2026-02-01T10:30:00Z",
+                        "presentCount": 12
+                    }
+                ],
+                "nextCursor": "EMP001"
+            }
+        }
+
+
 class EmployeeDeleteResponse(BaseModel):
     """Schema for employee deletion response"""
     message: str
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, func
+from sqlalchemy import Column, String, DateTime, FetchedValue, func
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
 from app.database.connection import Base
@@ -7,8 +7,9 @@ class Employee(Base):
     __tablename__ = "employees"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    employee_id = Column(String(50), unique=True, nullable=False, index=True)
+    # Defaults to next_employee_id() (sequence-backed EMP001, EMP002, ...) in the database
+    employee_id = Column(String(50), unique=True, nullable=False, index=True, server_default=FetchedValue())
     full_name = Column(String(200), nullable=False)
     email = Column(String(200), nullable=False)
     department = Column(String(100), nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
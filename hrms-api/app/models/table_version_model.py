@@ -0,0 +1,17 @@
+from sqlalchemy import Column, String, BigInteger, SmallInteger
+from app.database.connection import Base
+
+class TableVersion(Base):
+    """
+    One shard of a table's change counter.
+
+    Bumped by statement-level triggers on every write that changes rows (see
+    hrms-db/schema.sql); the shard is picked by backend PID so concurrent
+    writers do not contend. The table's version is the SUM over its shards.
+    Used to build ETags for read endpoints.
+    """
+    __tablename__ = "table_versions"
+
+    table_name = Column(String(63), primary_key=True)
+    shard = Column(SmallInteger, primary_key=True, default=0)
+    version = Column(BigInteger, nullable=False, default=0)
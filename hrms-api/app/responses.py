@@ -0,0 +1,92 @@
+"""
+Response classes
+Fast JSON rendering for endpoints that return trusted, already-shaped data,
+ETag helpers for conditional GETs and sparse fieldsets for list endpoints
+"""
+
+import hashlib
+from typing import Any, Dict, List, Optional, Sequence, Type
+
+import orjson
+from fastapi import Response, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _default(obj: Any) -> Any:
+    # Models built with model_construct() are serialized from their fields as-is
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Returning this from a route bypasses FastAPI's response_model
+    validation and jsonable_encoder pass, so it must only be used with data
+    the service layer built from database rows (response_model is still
+    declared on the route for the OpenAPI schema).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_UTC_Z)
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a weak ETag from a data version and the request parameters
+
+    Weak, because the same representation may be sent compressed or not.
+    """
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response for a matching conditional GET"""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=etag_headers(etag))
+
+
+def etag_headers(etag: str) -> dict:
+    # no-cache lets clients store the response but revalidate it on every use
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+
+def parse_fields(value: Optional[str], model: Type[BaseModel]) -> Optional[List[str]]:
+    """
+    Parse a comma-separated fields= parameter against a response model
+
+    Args:
+        value: Raw parameter value (e.g. "employeeId,fullName")
+        model: Model whose fields may be requested
+
+    Returns:
+        Requested field names in order without duplicates, or None for all fields
+
+    Raises:
+        ValueError: If a name is not a field of the model
+    """
+    if not value:
+        return None
+    names = list(dict.fromkeys(name.strip() for name in value.split(",") if name.strip()))
+    unknown = [name for name in names if name not in model.model_fields]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return names or None
+
+
+def sparse_items(items: Sequence[BaseModel], fields: Sequence[str]) -> List[Dict[str, Any]]:
+    """Keep only the requested fields of each item"""
+    return [{name: item.__dict__[name] for name in fields} for item in items]
@@ -3,11 +3,30 @@ Attendance routes
 Defines all attendance-related API endpoints
 """
 
-from fastapi import APIRouter, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date
+from typing import Literal, Optional
 
-from app.models.attendance import AttendanceCreate, AttendanceResponse
+from app.database.unit_of_work import get_read_session, get_session
+from app.models.attendance import (
+    AttendanceCreate,
+    AttendanceResponse,
+    AttendanceListResponse,
+    AttendanceBulkCreate,
+    AttendanceBulkResponse,
+    AttendanceMatrixResponse,
+)
 from app.services.attendance_service import attendance_service
+from app.services.attendance_batcher import attendance_batcher
+from app.services.version_service import version_service
+from app.services.exceptions import (
+    AttendanceConflictError,
+    EmployeeNotFoundError,
+    IdempotencyKeyReusedError,
+)
+from app.responses import ORJSONResponse, etag_headers, etag_matches, not_modified, parse_fields
 
 router = APIRouter(
     prefix="/attendance",
@@ -20,65 +39,222 @@ router = APIRouter(
     response_model=AttendanceResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Mark attendance",
-    description="Mark attendance for an employee on a specific date"
+    description="Mark attendance for an employee on a specific date (safe to retry)"
 )
-async def mark_attendance(attendance: AttendanceCreate):
+async def mark_attendance(
+    attendance: AttendanceCreate,
+    idempotency_key: Optional[str] = Header(None, max_length=255, description="Client-generated key identifying this request"),
+    session: AsyncSession = Depends(get_session)
+):
     """
     Mark attendance for an employee.
     
     - **employeeId**: Employee identifier
     - **date**: Date of attendance (YYYY-MM-DD)
     - **status**: Either "Present" or "Absent"
+    - **Idempotency-Key** header: (Optional) Unique key per logical request
     
-    Returns the created attendance record.
+    Returns the created attendance record with 201. Sending the same
+    employee, date and status again returns the existing record with 200
+    and an `Idempotent-Replayed: true` header. Each Idempotency-Key
+    belongs to one record, so a key sent again with a different employee,
+    date or status is rejected. When ATTENDANCE_BATCH_MAX_SIZE
+    is set, concurrent marks are written together in one transaction.
     
     Raises:
+    - 400: If the date is in the future
     - 404: If employee not found
-    - 409: If attendance already marked for this date
+    - 409: If attendance already marked with a different status for this date
+    - 422: If the Idempotency-Key was already used with a different employee, date or status
+    """
+    try:
+        result, created = await attendance_batcher.mark_attendance(session, attendance, idempotency_key)
+    except EmployeeNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except AttendanceConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except IdempotencyKeyReusedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    if created:
+        return ORJSONResponse(result, status_code=status.HTTP_201_CREATED)
+    return ORJSONResponse(
+        result,
+        status_code=status.HTTP_200_OK,
+        headers={"Idempotent-Replayed": "true"}
+    )
+
+
+@router.post(
+    "/bulk",
+    response_model=AttendanceBulkResponse,
+    summary="Mark attendance in bulk",
+    description="Mark attendance for many employees and dates in a single request"
+)
+async def mark_attendance_bulk(payload: AttendanceBulkCreate, session: AsyncSession = Depends(get_session)):
+    """
+    Mark attendance for many records at once.
+    
+    - **records**: List of attendance records (employeeId, date, status), up to 5000
+    
+    All valid records are written in one transaction. Each record gets its own
+    outcome instead of failing the whole request:
+    - **created**: Attendance was marked
+    - **duplicate**: Attendance already marked for this employee on this date
+    - **employee_not_found**: Employee does not exist
+    - **future_date**: Date is in the future
     """
     try:
-        result = await attendance_service.mark_attendance(attendance)
-        return result
+        result = await attendance_service.mark_attendance_bulk(session, payload.records)
+        return ORJSONResponse(result)
     except ValueError as e:
-        error_msg = str(e)
-        if "not found" in error_msg.lower():
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=error_msg
-            )
-        elif "already exists" in error_msg.lower() or "duplicate" in error_msg.lower():
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=error_msg
-            )
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=error_msg
-            )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.get(
+    "/matrix",
+    response_model=AttendanceMatrixResponse,
+    summary="Get monthly attendance matrix",
+    description="Get every employee's attendance for one month as a compact grid"
+)
+async def get_attendance_matrix(
+    month: str = Query(..., pattern=r"^\d{4}-(0[1-9]|1[0-2])$", description="Month (YYYY-MM)"),
+    department: Optional[str] = Query(None, description="Only employees in this department"),
+    session: AsyncSession = Depends(get_read_session)
+):
+    """
+    Get the attendance matrix for a month.
+    
+    - **month**: Month in YYYY-MM format
+    - **department**: Department name
+    
+    Each employee row has a `days` string with one character per day of the
+    month: `P` (Present), `A` (Absent) or `-` (not marked).
+    """
+    year, month_number = (int(part) for part in month.split("-"))
+    result = await attendance_service.get_attendance_matrix(session, year, month_number, department)
+    return ORJSONResponse(result)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export attendance records",
+    description="Stream attendance records as CSV or NDJSON"
+)
+async def export_attendance(
+    date_from: Optional[date] = Query(None, alias="from", description="First date to include (YYYY-MM-DD)"),
+    date_to: Optional[date] = Query(None, alias="to", description="Last date to include (YYYY-MM-DD)"),
+    department: Optional[str] = Query(None, description="Only employees in this department"),
+    export_format: Literal["csv", "ndjson"] = Query("csv", alias="format", description="Export format")
+):
+    """
+    Export attendance records with employee details.
+    
+    - **from** / **to**: Inclusive date range (both optional)
+    - **department**: Department name
+    - **format**: `csv` (default) or `ndjson`
+    
+    Rows are streamed ordered by date and employee ID, so large ranges start
+    downloading immediately.
+    
+    Raises:
+    - 400: If from is after to
+    """
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'from' must be on or before 'to'"
+        )
+
+    media_type = "text/csv" if export_format == "csv" else "application/x-ndjson"
+    filename = f"attendance_{date_from or 'start'}_{date_to or 'end'}.{export_format}"
+    return StreamingResponse(
+        attendance_service.export_attendance(date_from, date_to, department, export_format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
 
 
 @router.get(
     "/{employee_id}",
-    response_model=List[AttendanceResponse],
+    response_model=AttendanceListResponse,
     summary="Get attendance records",
-    description="Get all attendance records for a specific employee"
+    description="Get a page of attendance records for a specific employee"
 )
-async def get_attendance(employee_id: str):
+async def get_attendance(
+    employee_id: str,
+    date_from: Optional[date] = Query(None, alias="from", description="First date to include (YYYY-MM-DD)"),
+    date_to: Optional[date] = Query(None, alias="to", description="Last date to include (YYYY-MM-DD)"),
+    attendance_status: Optional[Literal["Present", "Absent"]] = Query(None, alias="status", description="Only records with this status"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    cursor: Optional[date] = Query(None, description="nextCursor from the previous page"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return per record, e.g. date,status"),
+    if_none_match: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_read_session)
+):
     """
-    Get all attendance records for an employee.
+    Get attendance records for an employee, most recent first.
     
     - **employee_id**: Employee identifier
+    - **from** / **to**: Inclusive date range (both optional)
+    - **status**: Either "Present" or "Absent"
+    - **limit**: Page size (1-1000, default 100)
+    - **cursor**: Pass the `nextCursor` of the previous page to get older records
+    - **fields**: Only return these fields of each record (all by default)
     
-    Returns a list of attendance records sorted by date (most recent first).
-    Returns an empty array if no attendance records exist.
+    Returns `items` (empty if no records match) and `nextCursor`,
+    which is null on the last page. Responses carry an `ETag`; send it back
+    in `If-None-Match` to get an empty 304 when nothing has changed.
     
     Raises:
+    - 400: If fields names an unknown field
     - 404: If employee not found
     """
     try:
-        result = await attendance_service.get_attendance_by_employee(employee_id)
-        return result
+        field_names = parse_fields(fields, AttendanceResponse)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    etag = await version_service.get_attendance_etag(
+        session,
+        employee_id, date_from, date_to, attendance_status, limit, cursor, field_names
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    try:
+        result = await attendance_service.get_attendance_by_employee(
+            session,
+            employee_id,
+            date_from=date_from,
+            date_to=date_to,
+            status=attendance_status,
+            limit=limit,
+            cursor=cursor,
+            fields=field_names
+        )
+        return ORJSONResponse(result, headers=etag_headers(etag))
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
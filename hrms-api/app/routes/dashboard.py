@@ -1,21 +1,28 @@
+from datetime import date, timedelta
+from typing import Optional
 
-from fastapi import APIRouter, Depends
-from sqlalchemy import select, func, distinct, desc
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from datetime import date
-from typing import List, Dict, Any
 
-from app.database.connection import db
-from app.models.employee_model import Employee
-from app.models.attendance_model import Attendance, AttendanceStatus
+from app.database.unit_of_work import get_read_session, unit_of_work
+
+from app.models.dashboard import DepartmentAnalyticsResponse
+from app.services.dashboard_service import dashboard_service
+from app.services.version_service import version_service
+from app.responses import ORJSONResponse, etag_headers, etag_matches, not_modified
 
 router = APIRouter(
     prefix="/dashboard",
     tags=["Dashboard"]
 )
 
+MAX_ANALYTICS_DAYS = 366
+
 @router.get("/stats")
-async def get_dashboard_stats():
+async def get_dashboard_stats(
+    if_none_match: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_read_session)
+):
     """
     Get dashboard statistics:
     - Total employees
@@ -23,59 +30,71 @@ async def get_dashboard_stats():
     - Absent today
     - Active departments
     - Recent attendance
+
+    Served from a short-lived in-process cache keyed by the data version.
+    Responses carry an `ETag`; send it back in `If-None-Match` to get an
+    empty 304 when nothing has changed.
     """
-    async with db.get_session() as session:
-        total_employees = await session.execute(select(func.count(Employee.id)))
-        total_employees = total_employees.scalar() or 0
+    today = date.today()
+    etag, versions = await version_service.get_etag(session, "dashboard", today)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
 
-        today = date.today()
-        
-        present_today = await session.execute(
-            select(func.count(Attendance.id))
-            .where(Attendance.date == today)
-            .where(Attendance.status == AttendanceStatus.Present)
-        )
-        present_today = present_today.scalar() or 0
-        
-        absent_today = await session.execute(
-            select(func.count(Attendance.id))
-            .where(Attendance.date == today)
-            .where(Attendance.status == AttendanceStatus.Absent)
-        )
-        absent_today = absent_today.scalar() or 0
+    stats = await dashboard_service.get_stats(session, today, versions)
+    return ORJSONResponse(stats, headers=etag_headers(etag))
 
-        active_departments = await session.execute(
-            select(func.count(distinct(Employee.department)))
-        )
-        active_departments = active_departments.scalar() or 0
 
-        recent_attendance_query = (
-            select(Attendance, Employee)
-            .join(Employee, Attendance.employee_id == Employee.employee_id)
-            .where(Attendance.date == today)
-            .order_by(desc(Attendance.created_at))
-            .limit(10)
+@router.get(
+    "/departments",
+    response_model=DepartmentAnalyticsResponse,
+    summary="Get department analytics",
+    description="Get per-department attendance totals, weekly trends and top absentees for a period"
+)
+async def get_department_analytics(
+    date_from: Optional[date] = Query(None, alias="from", description="First date to include (YYYY-MM-DD)"),
+    date_to: Optional[date] = Query(None, alias="to", description="Last date to include (YYYY-MM-DD)"),
+    top: int = Query(5, ge=1, le=50, description="Top absentees to list per department"),
+    if_none_match: Optional[str] = Header(None)
+):
+    """
+    Get attendance analytics per department:
+    - Headcount
+    - Present and absent counts and attendance rate
+    - Absence rate for every week of the period
+    - Employees with the most absences
+
+    - **from** / **to**: Inclusive date range (defaults to the last 28 days up to today, at most 366 days)
+    - **top**: Absentees per department (1-50, default 5)
+
+    Aggregated in the database, so the cost does not grow with the number of
+    records returned. If top absentees cannot be loaded in time, they are
+    left empty and `partial` is true. Responses carry an `ETag`; send it back in
+    `If-None-Match` to get an empty 304 when nothing has changed.
+
+    Raises:
+    - 400: If from is after to, or the range is longer than 366 days
+    """
+    date_to = date_to or date.today()
+    date_from = date_from or date_to - timedelta(days=27)
+    if date_from > date_to:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'from' must be on or before 'to'"
+        )
+    if (date_to - date_from).days >= MAX_ANALYTICS_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Date range must be at most {MAX_ANALYTICS_DAYS} days"
         )
-        recent_attendance_result = await session.execute(recent_attendance_query)
-        recent_attendance_rows = recent_attendance_result.all()
-        
-        recent_attendance = [
-            {
-                "id": str(att.id),
-                "employeeId": emp.employee_id,
-                "employeeName": emp.full_name,
-                "department": emp.department,
-                "date": att.date,
-                "status": att.status.value,
-                "createdAt": att.created_at
-            }
-            for att, emp in recent_attendance_rows
-        ]
 
-        return {
-            "totalEmployees": total_employees,
-            "presentToday": present_today,
-            "absentToday": absent_today,
-            "activeDepartments": active_departments,
-            "recentAttendance": recent_attendance
-        }
+    # Released before the parallel reads, which check out their own connections
+    async with unit_of_work(read_only=True) as session:
+        etag, _ = await version_service.get_etag(session, "departments", date_from, date_to, top)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    analytics = await dashboard_service.get_department_stats(date_from, date_to, top)
+    if analytics.partial:
+        # A partial response must not be revalidated as if it were complete
+        return ORJSONResponse(analytics, headers={"Cache-Control": "no-store"})
+    return ORJSONResponse(analytics, headers=etag_headers(etag))
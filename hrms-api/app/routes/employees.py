@@ -3,11 +3,21 @@ Employee routes
 Defines all employee-related API endpoints
 """
 
-from fastapi import APIRouter, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 
-from app.models.employee import EmployeeCreate, EmployeeResponse, EmployeeDeleteResponse
+from app.database.unit_of_work import get_read_session, get_session
+
+from app.models.employee import (
+    EmployeeCreate,
+    EmployeeResponse,
+    EmployeeListResponse,
+    EmployeeDeleteResponse,
+)
 from app.services.employee_service import employee_service
+from app.services.version_service import version_service
+from app.responses import ORJSONResponse, etag_headers, etag_matches, not_modified, parse_fields
 
 router = APIRouter(
     prefix="/employees",
@@ -22,7 +32,7 @@ router = APIRouter(
     summary="Create a new employee",
     description="Create a new employee (employee ID is auto-generated if not provided)"
 )
-async def create_employee(employee: EmployeeCreate):
+async def create_employee(employee: EmployeeCreate, session: AsyncSession = Depends(get_session)):
     """
     Create a new employee with the following information:
     
@@ -34,7 +44,7 @@ async def create_employee(employee: EmployeeCreate):
     Returns the created employee with database ID and timestamp.
     """
     try:
-        result = await employee_service.create_employee(employee)
+        result = await employee_service.create_employee(session, employee)
         return result
     except ValueError as e:
         raise HTTPException(
@@ -50,18 +60,56 @@ async def create_employee(employee: EmployeeCreate):
 
 @router.get(
     "",
-    response_model=List[EmployeeResponse],
-    summary="Get all employees",
-    description="Retrieve a list of all employees"
+    response_model=EmployeeListResponse,
+    summary="Get employees",
+    description="Retrieve a page of employees, optionally filtered by department or name"
 )
-async def get_all_employees():
+async def get_all_employees(
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of employees to return"),
+    cursor: Optional[str] = Query(None, description="nextCursor from the previous page"),
+    department: Optional[str] = Query(None, description="Only employees in this department"),
+    name: Optional[str] = Query(None, min_length=1, description="Only employees whose name contains this text"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return per employee, e.g. employeeId,fullName"),
+    if_none_match: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_read_session)
+):
     """
-    Get all employees in the system.
+    Get a page of employees ordered by employee ID.
+    
+    - **limit**: Page size (1-500, default 50)
+    - **cursor**: Pass the `nextCursor` of the previous page to get the next one
+    - **department**: Exact department name
+    - **name**: Case-insensitive substring of the full name
+    - **fields**: Only return these fields of each employee (all by default)
+    
+    Returns `items` (empty if no employees match) and `nextCursor`,
+    which is null on the last page. Responses carry an `ETag`; send it back
+    in `If-None-Match` to get an empty 304 when nothing has changed.
     
-    Returns an empty array if no employees exist.
+    Raises:
+    - 400: If fields names an unknown field
     """
-    result = await employee_service.get_all_employees()
-    return result
+    try:
+        field_names = parse_fields(fields, EmployeeResponse)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    etag, _ = await version_service.get_etag(session, "employees", limit, cursor, department, name, field_names)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    result = await employee_service.get_all_employees(
+        session,
+        limit=limit,
+        cursor=cursor,
+        department=department,
+        name=name,
+        fields=field_names
+    )
+    return ORJSONResponse(result, headers=etag_headers(etag))
 
 
 @router.get(
@@ -70,7 +118,7 @@ async def get_all_employees():
     summary="Get employee by ID",
     description="Retrieve a specific employee by their employee ID (e.g., EMP001)"
 )
-async def get_employee(employee_id: str):
+async def get_employee(employee_id: str, session: AsyncSession = Depends(get_read_session)):
     """
     Get a specific employee by their employee ID.
     
@@ -79,8 +127,8 @@ async def get_employee(employee_id: str):
     Returns 404 if employee not found.
     """
     try:
-        result = await employee_service.get_employee_by_id(employee_id)
-        return result
+        result = await employee_service.get_employee_by_id(session, employee_id)
+        return ORJSONResponse(result)
     except ValueError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -94,7 +142,7 @@ async def get_employee(employee_id: str):
     summary="Delete an employee",
     description="Delete an employee by their employee ID (e.g., EMP001)"
 )
-async def delete_employee(employee_id: str):
+async def delete_employee(employee_id: str, session: AsyncSession = Depends(get_session)):
     """
     Delete an employee from the system.
     
@@ -104,7 +152,7 @@ async def delete_employee(employee_id: str):
     Returns 404 if employee not found.
     """
     try:
-        result = await employee_service.delete_employee(employee_id)
+        result = await employee_service.delete_employee(session, employee_id)
         return result
     except ValueError:
         raise HTTPException(
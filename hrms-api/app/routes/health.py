@@ -6,7 +6,8 @@ Provides API health status
 from fastapi import APIRouter
 from datetime import datetime
 
-from app.models.common import HealthResponse
+from app.models.common import HealthResponse, PoolStats
+from app.database.connection import db
 
 router = APIRouter(
     prefix="/health",
@@ -24,10 +25,14 @@ async def health_check():
     """
     Health check endpoint.
     
-    Returns the current status and timestamp.
+    Returns the current status, timestamp and connection pool statistics
+    for the primary database and, when configured, the read replica.
     Use this to verify that the API is running properly.
     """
+    replica_stats = db.pool_stats(replica=True)
     return HealthResponse(
         status="healthy",
-        timestamp=datetime.utcnow()
+        timestamp=datetime.utcnow(),
+        database=PoolStats(**db.pool_stats()),
+        readReplica=PoolStats(**replica_stats) if replica_stats else None
     )
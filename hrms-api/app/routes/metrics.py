@@ -0,0 +1,36 @@
+"""
+Metrics routes
+Exposes application metrics for Prometheus
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app import metrics
+
+router = APIRouter(
+    prefix="/metrics",
+    tags=["Metrics"]
+)
+
+
+@router.get(
+    "",
+    response_class=PlainTextResponse,
+    summary="Prometheus metrics",
+    description="Request latency, per-request database usage and pool wait times"
+)
+async def get_metrics():
+    """
+    Metrics in the Prometheus text exposition format.
+    
+    - **hrms_http_request_duration_seconds**: Latency per route
+    - **hrms_http_request_db_queries** / **hrms_http_request_db_seconds**: Database work per request
+    - **hrms_db_query_duration_seconds**: Latency per SQL statement
+    - **hrms_db_slow_queries_total**: Statements over SLOW_QUERY_THRESHOLD_MS
+    - **hrms_db_pool_checkout_wait_seconds**: Time waiting for a pooled connection
+    """
+    return PlainTextResponse(
+        metrics.render(),
+        media_type="text/plain; version=0.0.4"
+    )
@@ -0,0 +1,170 @@
+"""
+Attendance write batching
+Coalesces concurrent single-record marks into multi-row transactions
+"""
+
+import asyncio
+import contextvars
+import logging
+from datetime import date as date_obj
+from typing import List, Optional, Tuple
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import connection
+from app.database.unit_of_work import unit_of_work
+from app.metrics import attendance_batch_size
+from app.middleware.error_handler import QUERY_CANCELED
+from app.models.attendance import AttendanceCreate, AttendanceResponse
+from app.services.attendance_service import attendance_service
+from app.services.exceptions import InvalidAttendanceDateError
+
+logger = logging.getLogger(__name__)
+
+
+class AttendanceBatcher:
+    """
+    Process-local coalescer for POST /api/attendance.
+
+    Marks are held for at most max_wait seconds, or until max_size of them
+    are waiting, and then written together with
+    AttendanceService.mark_attendance_batch: one transaction and one commit
+    instead of one per request. Each caller still gets its own record or
+    error. With max_size of 1 or less every mark is written on its own, as
+    before. At most max_writes batches are written at once, so batching
+    never holds more than max_writes pooled connections.
+    """
+
+    def __init__(self, max_size: int, max_wait: float, max_writes: int):
+        self.max_size = max_size
+        self.max_wait = max_wait
+        self.max_writes = max_writes
+        self._write_slots: Optional[asyncio.Semaphore] = None
+        self._pending: List[Tuple[AttendanceCreate, Optional[str], asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._writes = set()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 1
+
+    async def mark_attendance(
+        self,
+        session: AsyncSession,
+        attendance_data: AttendanceCreate,
+        idempotency_key: Optional[str] = None
+    ) -> Tuple[AttendanceResponse, bool]:
+        """
+        Mark attendance, batched with other marks arriving at the same time
+
+        Same contract as AttendanceService.mark_attendance. Batches are
+        written in their own units of work.
+
+        Args:
+            session: The request's session, used when batching is disabled
+            attendance_data: Attendance creation data
+            idempotency_key: Optional client-supplied key identifying the request
+
+        Returns:
+            Attendance response and whether a new record was created
+
+        Raises:
+            InvalidAttendanceDateError: If the date is in the future
+            EmployeeNotFoundError: If employee not found
+            AttendanceConflictError: If marked with a different status for this date
+            IdempotencyKeyReusedError: If the key was used with a different employee, date or status
+        """
+        if not self.enabled:
+            return await attendance_service.mark_attendance(session, attendance_data, idempotency_key)
+
+        if attendance_data.date > date_obj.today():
+            raise InvalidAttendanceDateError()
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((attendance_data, idempotency_key, future))
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    async def close(self) -> None:
+        """Write any waiting marks and wait for writes in progress; called on shutdown"""
+        self._flush()
+        if self._writes:
+            await asyncio.gather(*self._writes, return_exceptions=True)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        # Callers that gave up (e.g. client disconnected) are dropped
+        batch = [entry for entry in self._pending if not entry[2].done()]
+        self._pending = []
+        if not batch:
+            return
+
+        # Run in a fresh context so the batch's queries are not counted
+        # against whichever request happened to trigger the flush
+        context = contextvars.Context()
+        context.run(connection.statement_timeout_ms.set, settings.write_statement_timeout_ms)
+        task = context.run(asyncio.ensure_future, self._write(batch))
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    async def _write(self, batch: List[Tuple[AttendanceCreate, Optional[str], asyncio.Future]]) -> None:
+        entries = [(attendance_data, idempotency_key) for attendance_data, idempotency_key, _ in batch]
+        attendance_batch_size.observe(len(batch))
+        if self._write_slots is None:
+            self._write_slots = asyncio.Semaphore(max(self.max_writes, 1))
+        try:
+            async with self._write_slots:
+                results = await self._write_entries(entries)
+
+            for (_, _, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        except asyncio.CancelledError:
+            for _, _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            # Nothing awaits this task, so the error is only reported to the callers
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+    async def _write_entries(self, entries: List[Tuple[AttendanceCreate, Optional[str]]]) -> list:
+        try:
+            async with unit_of_work() as session:
+                return await attendance_service.mark_attendance_batch(session, entries)
+        except SQLAlchemyError as e:
+            if getattr(getattr(e, "orig", None), "sqlstate", None) == QUERY_CANCELED:
+                # Overloaded: retrying each record would only time out again
+                raise
+            # E.g. an employee deleted mid-batch fails the whole statement;
+            # retry one by one so only the affected callers see an error
+            logger.warning("Attendance batch of %d failed, retrying records individually", len(entries), exc_info=True)
+            results = []
+            for attendance_data, idempotency_key in entries:
+                try:
+                    async with unit_of_work() as session:
+                        results.append(await attendance_service.mark_attendance(session, attendance_data, idempotency_key))
+                except ValueError as e:
+                    results.append(e)
+            return results
+
+
+# Batcher instance
+attendance_batcher = AttendanceBatcher(
+    max_size=settings.attendance_batch_max_size,
+    max_wait=settings.attendance_batch_max_wait_ms / 1000,
+    max_writes=settings.attendance_batch_max_writes
+)
@@ -3,111 +3,703 @@ Attendance service layer
 Handles business logic for attendance operations
 """
 
-from typing import List
-from sqlalchemy import select, desc
-from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from app.models.attendance import AttendanceCreate, AttendanceResponse
+import calendar
+import csv
+import io
+import json
+import uuid
+from datetime import date as date_obj
+from typing import AsyncIterator, List, Optional, Sequence, Tuple, Union
+from sqlalchemy import select, desc, update, func, text, and_, literal, literal_column, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.attendance import (
+    AttendanceCreate,
+    AttendanceResponse,
+    AttendanceListResponse,
+    AttendanceBulkResponse,
+    AttendanceBulkResult,
+    AttendanceMatrixRow,
+    AttendanceMatrixResponse,
+)
 from app.models.employee_model import Employee
 from app.models.attendance_model import Attendance, AttendanceStatus
+from app.models.attendance_summary_model import AttendanceSummary
+from app.models.table_version_model import TableVersion
 from app.database.connection import db
+from app.database.unit_of_work import after_commit
+from app.cache import dashboard_cache
+from app.responses import sparse_items
+from app.services.employee_directory import DirectoryEntry, employee_directory
+from app.services.exceptions import (
+    AttendanceConflictError,
+    EmployeeNotFoundError,
+    IdempotencyKeyReusedError,
+    InvalidAttendanceDateError,
+)
+
+EXPORT_BATCH_SIZE = 1000
+EXPORT_COLUMNS = ("employeeId", "fullName", "department", "date", "status", "createdAt")
+FOREIGN_KEY_VIOLATION = "23503"
+UNIQUE_VIOLATION = "23505"
+MATRIX_CODES = {AttendanceStatus.Present: "P", AttendanceStatus.Absent: "A"}
 
 
 class AttendanceService:
     """Service class for attendance operations"""
 
-    async def mark_attendance(self, attendance_data: AttendanceCreate) -> AttendanceResponse:
+    async def mark_attendance(
+        self,
+        session: AsyncSession,
+        attendance_data: AttendanceCreate,
+        idempotency_key: Optional[str] = None
+    ) -> Tuple[AttendanceResponse, bool]:
         """
         Mark attendance for an employee
 
+        Written as a single INSERT ... ON CONFLICT DO NOTHING ... RETURNING.
+        When the record already exists it is read back with one SELECT, so
+        re-sending the same employee, date and status (e.g. a kiosk retry)
+        returns it as a replay without locking or rewriting the row; only a
+        different status for the same day is a conflict. Idempotency keys
+        are unique across records, so a key already stored with a
+        different employee, date or status is rejected; the key is only
+        looked up when the write did not insert a record under it.
+
         Args:
+            session: The unit of work's session
             attendance_data: Attendance creation data
+            idempotency_key: Optional client-supplied key identifying the request
 
         Returns:
-            Created attendance response
+            Attendance response and whether a new record was created
 
         Raises:
-            ValueError: If employee not found or duplicate attendance
+            InvalidAttendanceDateError: If the date is in the future
+            EmployeeNotFoundError: If employee not found
+            AttendanceConflictError: If marked with a different status for this date
+            IdempotencyKeyReusedError: If the key was used with a different employee, date or status
         """
-        async with db.get_session() as session:
-            try:
-                from datetime import date as date_obj
-                if attendance_data.date > date_obj.today():
-                    raise ValueError("Cannot mark attendance for future dates")
-
-                # Check if employee exists
-                employee = await session.execute(
-                    select(Employee).where(Employee.employee_id == attendance_data.employeeId)
+        if attendance_data.date > date_obj.today():
+            raise InvalidAttendanceDateError()
+
+        status = AttendanceStatus(attendance_data.status)
+        record_columns = (
+            Attendance.id,
+            Attendance.employee_id,
+            Attendance.date,
+            Attendance.status,
+            Attendance.created_at,
+            Attendance.idempotency_key
+        )
+        insert_stmt = (
+            pg_insert(Attendance)
+            .values(
+                id=uuid.uuid4(),
+                employee_id=attendance_data.employeeId,
+                date=attendance_data.date,
+                status=status,
+                idempotency_key=idempotency_key
+            )
+            .on_conflict_do_nothing(index_elements=["employee_id", "date"])
+            .returning(*record_columns, literal_column("true").label("inserted"))
+        )
+
+        try:
+            result = await session.execute(insert_stmt)
+            row = result.first()
+            if row is None:
+                result = await session.execute(
+                    select(*record_columns, literal_column("false").label("inserted"))
+                    .where(Attendance.employee_id == attendance_data.employeeId)
+                    .where(Attendance.date == attendance_data.date)
+                )
+                row = result.first()
+                if row is None:
+                    # Attendance records are only removed with their employee
+                    raise EmployeeNotFoundError()
+
+            # Existing record has a different status, or was not created under this key
+            if row.status != status or (idempotency_key and row.idempotency_key != idempotency_key):
+                key_used = bool(idempotency_key) and (
+                    row.idempotency_key == idempotency_key
+                    or await session.scalar(
+                        select(literal(True)).where(Attendance.idempotency_key == idempotency_key)
+                    )
+                )
+                if key_used:
+                    raise IdempotencyKeyReusedError()
+                if row.status != status:
+                    raise AttendanceConflictError()
+
+        except IntegrityError as e:
+            sqlstate = getattr(e.orig, "sqlstate", None)
+            if sqlstate == FOREIGN_KEY_VIOLATION:
+                raise EmployeeNotFoundError()
+            if sqlstate == UNIQUE_VIOLATION:
+                # The key is stored with another employee or date
+                raise IdempotencyKeyReusedError()
+            raise
+
+        if row.inserted:
+            after_commit(session, dashboard_cache.invalidate)
+
+        return AttendanceResponse.model_construct(
+            id=str(row.id),
+            employeeId=row.employee_id,
+            date=row.date,
+            status=row.status.value,
+            createdAt=row.created_at
+        ), row.inserted
+
+    async def mark_attendance_batch(
+        self,
+        session: AsyncSession,
+        entries: Sequence[Tuple[AttendanceCreate, Optional[str]]]
+    ) -> List[Union[Tuple[AttendanceResponse, bool], ValueError]]:
+        """
+        Mark attendance for several independent requests in one transaction
+
+        Used by the attendance batcher to write concurrent single-record
+        marks together. Every entry gets the result mark_attendance would
+        have given it had the entries run one after another: employees are
+        checked against the employee directory and one lookup for the rest,
+        all records are written with one multi-row
+        INSERT ... ON CONFLICT DO NOTHING, and rows that already existed are
+        read with one more query (so replays write nothing). Idempotency keys
+        are looked up together first; a key already stored, or sent earlier
+        in the batch, for another employee or date is rejected.
+
+        Args:
+            session: The unit of work's session
+            entries: (attendance data, idempotency key) pairs; dates must not be in the future
+
+        Returns:
+            Per entry, either (response, created) or the error mark_attendance would raise
+
+        Raises:
+            SQLAlchemyError: On database errors; the unit of work must then be rolled back
+        """
+        keys = {idempotency_key for _, idempotency_key in entries if idempotency_key}
+        key_records = {}
+        if keys:
+            result = await session.execute(
+                select(Attendance.idempotency_key, Attendance.employee_id, Attendance.date)
+                .where(Attendance.idempotency_key.in_(keys))
+            )
+            key_records = {row.idempotency_key: (row.employee_id, row.date) for row in result.all()}
+        # A new key belongs to the first record it is sent with
+        for attendance_data, idempotency_key in entries:
+            if idempotency_key:
+                key_records.setdefault(idempotency_key, (attendance_data.employeeId, attendance_data.date))
+
+        # Later entries for the same employee and date are answered from the row the first one wrote;
+        # entries whose key belongs to another record write nothing
+        first_index = {}
+        for index, (attendance_data, idempotency_key) in enumerate(entries):
+            key = (attendance_data.employeeId, attendance_data.date)
+            if not idempotency_key or key_records[idempotency_key] == key:
+                first_index.setdefault(key, index)
+
+        generation = employee_directory.generation
+        employee_ids = {employee_id for employee_id, _ in first_index}
+        known_ids = {
+            employee_id for employee_id in employee_ids
+            if employee_directory.get(employee_id) is not None
+        }
+        if len(known_ids) < len(employee_ids):
+            result = await session.execute(
+                select(Employee.id, Employee.employee_id, Employee.full_name, Employee.department)
+                .where(Employee.employee_id.in_(employee_ids - known_ids))
+            )
+            for row in result.all():
+                known_ids.add(row.employee_id)
+                employee_directory.add(DirectoryEntry(*row), generation)
+
+        values = [
+            {
+                "id": uuid.uuid4(),
+                "employee_id": employee_id,
+                "date": day,
+                "status": AttendanceStatus(entries[index][0].status),
+                "idempotency_key": entries[index][1]
+            }
+            for (employee_id, day), index in first_index.items()
+            if employee_id in known_ids
+        ]
+        rows = {}
+        if values:
+            result = await session.execute(
+                pg_insert(Attendance)
+                .values(values)
+                .on_conflict_do_nothing(index_elements=["employee_id", "date"])
+                .returning(
+                    Attendance.id,
+                    Attendance.employee_id,
+                    Attendance.date,
+                    Attendance.status,
+                    Attendance.created_at,
+                    Attendance.idempotency_key,
+                    literal_column("true").label("inserted")
                 )
-                employee = employee.scalar_one_or_none()
-                if not employee:
-                    raise ValueError("Employee not found")
-
-                attendance = Attendance(
-                    employee_id=attendance_data.employeeId,
-                    date=attendance_data.date,
-                    status=AttendanceStatus(attendance_data.status)
+            )
+            rows = {(row.employee_id, row.date): row for row in result.all()}
+
+        conflicts = [
+            key for key in first_index
+            if key[0] in known_ids and key not in rows
+        ]
+        if conflicts:
+            # Existing records: replays of the first entry or a different status
+            result = await session.execute(
+                select(
+                    Attendance.id,
+                    Attendance.employee_id,
+                    Attendance.date,
+                    Attendance.status,
+                    Attendance.created_at,
+                    Attendance.idempotency_key,
+                    literal_column("false").label("inserted")
                 )
+                .where(tuple_(Attendance.employee_id, Attendance.date).in_(conflicts))
+            )
+            rows.update({(row.employee_id, row.date): row for row in result.all()})
 
-                session.add(attendance)
-                await session.commit()
-                await session.refresh(attendance)
+        if any(row.inserted for row in rows.values()):
+            after_commit(session, dashboard_cache.invalidate)
 
-                return AttendanceResponse(
-                    id=str(attendance.id),
-                    employeeId=attendance.employee_id,
-                    date=attendance.date,
-                    status=attendance.status.value,
-                    createdAt=attendance.created_at
+        results = []
+        for index, (attendance_data, idempotency_key) in enumerate(entries):
+            key = (attendance_data.employeeId, attendance_data.date)
+            row = rows.get(key)
+            if idempotency_key and key_records[idempotency_key] != key:
+                results.append(IdempotencyKeyReusedError())
+            elif row is None:
+                results.append(EmployeeNotFoundError())
+            elif row.status.value != attendance_data.status:
+                if idempotency_key and row.idempotency_key == idempotency_key:
+                    results.append(IdempotencyKeyReusedError())
+                else:
+                    results.append(AttendanceConflictError())
+            else:
+                results.append((
+                    AttendanceResponse.model_construct(
+                        id=str(row.id),
+                        employeeId=row.employee_id,
+                        date=row.date,
+                        status=row.status.value,
+                        createdAt=row.created_at
+                    ),
+                    row.inserted and first_index[key] == index
+                ))
+        return results
+
+    async def mark_attendance_bulk(
+        self,
+        session: AsyncSession,
+        records: List[AttendanceCreate]
+    ) -> AttendanceBulkResponse:
+        """
+        Mark attendance for many employees in a single transaction
+
+        Employee existence is checked with one set-based lookup and all valid
+        records are written with one multi-row INSERT ... ON CONFLICT DO NOTHING,
+        so existing (employee_id, date) pairs are reported as duplicates
+        instead of failing the whole batch.
+
+        Args:
+            session: The unit of work's session
+            records: Attendance records to mark
+
+        Returns:
+            Per-record outcomes in request order
+
+        Raises:
+            ValueError: If an employee was deleted while the records were written
+        """
+        today = date_obj.today()
+        outcomes = [None] * len(records)
+        pending = {}
+
+        for index, record in enumerate(records):
+            key = (record.employeeId, record.date)
+            if record.date > today:
+                outcomes[index] = "future_date"
+            elif key in pending:
+                outcomes[index] = "duplicate"
+            else:
+                pending[key] = index
+
+        inserted = {}
+        try:
+            if pending:
+                employee_ids = {employee_id for employee_id, _ in pending}
+                result = await session.execute(
+                    select(Employee.employee_id).where(Employee.employee_id.in_(employee_ids))
                 )
+                known_ids = set(result.scalars().all())
+
+                rows = []
+                for (employee_id, day), index in pending.items():
+                    if employee_id not in known_ids:
+                        outcomes[index] = "employee_not_found"
+                        continue
+                    rows.append({
+                        "id": uuid.uuid4(),
+                        "employee_id": employee_id,
+                        "date": day,
+                        "status": AttendanceStatus(records[index].status)
+                    })
+
+                if rows:
+                    result = await session.execute(
+                        pg_insert(Attendance)
+                        .values(rows)
+                        .on_conflict_do_nothing(index_elements=["employee_id", "date"])
+                        .returning(
+                            Attendance.id,
+                            Attendance.employee_id,
+                            Attendance.date,
+                            Attendance.created_at
+                        )
+                    )
+                    inserted = {
+                        (row.employee_id, row.date): row for row in result.all()
+                    }
+                if inserted:
+                    after_commit(session, dashboard_cache.invalidate)
+
+        except IntegrityError:
+            raise ValueError("Employee was deleted while marking attendance, please retry")
+
+        results = []
+        for index, record in enumerate(records):
+            row = None
+            outcome = outcomes[index]
+            if outcome is None:
+                row = inserted.get((record.employeeId, record.date))
+                outcome = "created" if row else "duplicate"
+            results.append(AttendanceBulkResult.model_construct(
+                index=index,
+                employeeId=record.employeeId,
+                date=record.date,
+                outcome=outcome,
+                id=str(row.id) if row else None,
+                createdAt=row.created_at if row else None
+            ))
 
-            except IntegrityError:
-                await session.rollback()
-                raise ValueError("Attendance already marked for this employee on this date")
-            except SQLAlchemyError as e:
-                await session.rollback()
-                raise ValueError(f"Database error: {str(e)}")
+        created = len(inserted)
+        return AttendanceBulkResponse.model_construct(
+            created=created,
+            skipped=len(records) - created,
+            results=results
+        )
 
-    async def get_attendance_by_employee(self, employee_id: str) -> List[AttendanceResponse]:
+    async def get_attendance_by_employee(
+        self,
+        session: AsyncSession,
+        employee_id: str,
+        date_from: Optional[date_obj] = None,
+        date_to: Optional[date_obj] = None,
+        status: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[date_obj] = None,
+        fields: Optional[List[str]] = None
+    ) -> AttendanceListResponse:
         """
-        Get all attendance records for an employee
+        Get a page of attendance records for an employee
+
+        Employees in the directory cache are known to exist, so only their
+        records are read. Otherwise the employee row is LEFT JOINed to the
+        matching attendance records, so existence is checked in the same
+        query that reads the page, and the employee is cached. Rows read
+        from the replica are never cached: it may still show an employee
+        whose delete already cleared the cache.
+        Records are read newest first from the (employee_id, date) index.
 
         Args:
+            session: Read session (the replica when one is configured)
             employee_id: Employee identifier
+            date_from: First date to include
+            date_to: Last date to include
+            status: Only include records with this status
+            limit: Maximum number of records to return
+            cursor: Date of the last record on the previous page
+            fields: Only return these fields of each record (all when None)
 
         Returns:
-            List of attendance records sorted by date (descending)
+            Page of attendance records sorted by date (descending)
 
         Raises:
             ValueError: If employee not found
         """
-        async with db.get_session() as session:
-            try:
-                # Check if employee exists
-                employee = await session.execute(
-                    select(Employee).where(Employee.employee_id == employee_id)
+        filters = []
+        if date_from:
+            filters.append(Attendance.date >= date_from)
+        if date_to:
+            filters.append(Attendance.date <= date_to)
+        if status:
+            filters.append(Attendance.status == AttendanceStatus(status))
+        if cursor:
+            filters.append(Attendance.date < cursor)
+        record_columns = (Attendance.id, Attendance.date, Attendance.status, Attendance.created_at)
+
+        generation = employee_directory.generation
+        cached = employee_directory.get(employee_id) is not None
+        if cached:
+            query = (
+                select(Attendance.employee_id, *record_columns)
+                .where(Attendance.employee_id == employee_id, *filters)
+            )
+        else:
+            query = (
+                select(
+                    Employee.employee_id,
+                    *record_columns,
+                    Employee.id.label("employee_uuid"),
+                    Employee.full_name,
+                    Employee.department
                 )
-                if not employee.scalar_one_or_none():
-                    raise ValueError("Employee not found")
+                .outerjoin(Attendance, and_(Attendance.employee_id == Employee.employee_id, *filters))
+                .where(Employee.employee_id == employee_id)
+            )
 
-                result = await session.execute(
-                    select(Attendance)
-                    .where(Attendance.employee_id == employee_id)
-                    .order_by(desc(Attendance.date))
+        result = await session.execute(
+            query
+            .order_by(desc(Attendance.date))
+            # Fetch one extra row to know whether another page exists
+            .limit(limit + 1)
+        )
+        rows = result.all()
+
+        if not cached:
+            if not rows:
+                raise EmployeeNotFoundError()
+            if not db.is_replica(session):
+                employee_directory.add(DirectoryEntry(
+                    id=rows[0].employee_uuid,
+                    employee_id=rows[0].employee_id,
+                    full_name=rows[0].full_name,
+                    department=rows[0].department
+                ), generation)
+
+        # An employee without matching records comes back as one all-NULL row
+        records = [row for row in rows if row.id is not None]
+        has_more = len(records) > limit
+        records = records[:limit]
+
+        items = [
+            AttendanceResponse.model_construct(
+                id=str(att.id),
+                employeeId=att.employee_id,
+                date=att.date,
+                status=att.status.value,
+                createdAt=att.created_at
+            )
+            for att in records
+        ]
+        return AttendanceListResponse.model_construct(
+            items=sparse_items(items, fields) if fields else items,
+            nextCursor=records[-1].date if has_more else None
+        )
+
+    async def get_attendance_matrix(
+        self,
+        session: AsyncSession,
+        year: int,
+        month: int,
+        department: Optional[str] = None
+    ) -> AttendanceMatrixResponse:
+        """
+        Get an employees x days attendance grid for one month
+
+        Built from a single range query: employees LEFT JOIN that month's
+        attendance, which is served by the (employee_id, date) index.
+
+        Args:
+            session: Read session (the replica when one is configured)
+            year: Calendar year
+            month: Calendar month (1-12)
+            department: Only include employees in this department
+
+        Returns:
+            One row per employee with a per-day status string
+        """
+        days_in_month = calendar.monthrange(year, month)[1]
+        first_day = date_obj(year, month, 1)
+        last_day = date_obj(year, month, days_in_month)
+
+        query = (
+            select(
+                Employee.employee_id,
+                Employee.full_name,
+                Employee.department,
+                Attendance.date,
+                Attendance.status
+            )
+            .outerjoin(
+                Attendance,
+                and_(
+                    Attendance.employee_id == Employee.employee_id,
+                    Attendance.date >= first_day,
+                    Attendance.date <= last_day
                 )
-                attendance_records = result.scalars().all()
-
-                return [
-                    AttendanceResponse(
-                        id=str(att.id),
-                        employeeId=att.employee_id,
-                        date=att.date,
-                        status=att.status.value,
-                        createdAt=att.created_at
-                    )
-                    for att in attendance_records
-                ]
-            except SQLAlchemyError as e:
-                raise ValueError(f"Database error: {str(e)}")
+            )
+            .order_by(Employee.employee_id)
+        )
+        if department:
+            query = query.where(Employee.department == department)
+
+        result = await session.execute(query)
+        rows = result.all()
+
+        # Rows are ordered by employee, one row per marked day (or one empty row)
+        grid = {}
+        for row in rows:
+            if row.employee_id not in grid:
+                grid[row.employee_id] = (row, ["-"] * days_in_month)
+            if row.date is not None:
+                grid[row.employee_id][1][row.date.day - 1] = MATRIX_CODES[row.status]
+
+        employees = [
+            AttendanceMatrixRow.model_construct(
+                employeeId=employee.employee_id,
+                fullName=employee.full_name,
+                department=employee.department,
+                days="".join(days)
+            )
+            for employee, days in grid.values()
+        ]
+
+        return AttendanceMatrixResponse.model_construct(
+            month=f"{year:04d}-{month:02d}",
+            daysInMonth=days_in_month,
+            employees=employees
+        )
+
+    async def export_attendance(
+        self,
+        date_from: Optional[date_obj] = None,
+        date_to: Optional[date_obj] = None,
+        department: Optional[str] = None,
+        export_format: str = "csv"
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream attendance records joined with employee details
+
+        Rows are read from the read session (the replica when one is
+        configured) through a server-side cursor and encoded one partition
+        at a time, so memory use does not depend on the size of the range
+        and long exports do not hold primary connections.
+
+        Args:
+            date_from: First date to include
+            date_to: Last date to include
+            department: Only include employees in this department
+            export_format: "csv" or "ndjson"
+
+        Yields:
+            Encoded chunks of the export
+        """
+        query = (
+            select(
+                Attendance.employee_id,
+                Employee.full_name,
+                Employee.department,
+                Attendance.date,
+                Attendance.status,
+                Attendance.created_at
+            )
+            .join(Employee, Attendance.employee_id == Employee.employee_id)
+            .order_by(Attendance.date, Attendance.employee_id)
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        if date_from:
+            query = query.where(Attendance.date >= date_from)
+        if date_to:
+            query = query.where(Attendance.date <= date_to)
+        if department:
+            query = query.where(Employee.department == department)
+
+        if export_format == "csv":
+            yield (",".join(EXPORT_COLUMNS) + "\r\n").encode()
+
+        async with db.get_read_session() as session:
+            result = await session.stream(query)
+            async for partition in result.partitions():
+                buffer = io.StringIO()
+                if export_format == "csv":
+                    writer = csv.writer(buffer)
+                    for row in partition:
+                        writer.writerow((
+                            row.employee_id,
+                            row.full_name,
+                            row.department,
+                            row.date.isoformat(),
+                            row.status.value,
+                            row.created_at.isoformat() if row.created_at else ""
+                        ))
+                else:
+                    for row in partition:
+                        buffer.write(json.dumps({
+                            "employeeId": row.employee_id,
+                            "fullName": row.full_name,
+                            "department": row.department,
+                            "date": row.date.isoformat(),
+                            "status": row.status.value,
+                            "createdAt": row.created_at.isoformat() if row.created_at else None
+                        }))
+                        buffer.write("\n")
+                yield buffer.getvalue().encode()
+
+    async def rebuild_summary(self) -> int:
+        """
+        Recompute the attendance_summary counters from the attendance table
+
+        Attendance writes are blocked while the rebuild runs so that no
+        trigger update is lost while the counters are recomputed. Rows are
+        reset and upserted rather than deleted, so every employee's
+        attendance version keeps increasing, and the attendance version is
+        bumped so cached present counts are refetched.
+
+        Returns:
+            Number of employees with attendance counters
+        """
+        async with db.get_session() as session:
+            await session.execute(text("LOCK TABLE attendance IN SHARE MODE"))
+            await session.execute(
+                update(AttendanceSummary).values(
+                    present_count=0,
+                    absent_count=0,
+                    version=AttendanceSummary.version + 1
+                )
+            )
+            insert_counts = pg_insert(AttendanceSummary).from_select(
+                ["employee_id", "present_count", "absent_count", "version"],
+                select(
+                    Attendance.employee_id,
+                    func.count().filter(Attendance.status == AttendanceStatus.Present),
+                    func.count().filter(Attendance.status == AttendanceStatus.Absent),
+                    literal(1)
+                ).group_by(Attendance.employee_id)
+            )
+            result = await session.execute(
+                insert_counts.on_conflict_do_update(
+                    index_elements=[AttendanceSummary.employee_id],
+                    set_={
+                        "present_count": insert_counts.excluded.present_count,
+                        "absent_count": insert_counts.excluded.absent_count,
+                    }
+                )
+            )
+            await session.execute(
+                update(TableVersion)
+                .where(TableVersion.table_name == "attendance", TableVersion.shard == 0)
+                .values(version=TableVersion.version + 1)
+            )
+            await session.commit()
+            return result.rowcount
 
 
 # Service instance
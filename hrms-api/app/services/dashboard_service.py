@@ -0,0 +1,253 @@
+"""
+Dashboard service layer
+Handles aggregation for the dashboard statistics
+"""
+
+from datetime import date, timedelta
+from typing import Any, Dict, Hashable
+from sqlalchemy import select, func, distinct, desc, true, and_, cast, literal_column, tuple_, Date
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache import dashboard_cache
+from app.models.dashboard import (
+    DepartmentWeek,
+    DepartmentAbsentee,
+    DepartmentStats,
+    DepartmentAnalyticsResponse,
+)
+from app.models.employee_model import Employee
+from app.models.attendance_model import Attendance, AttendanceStatus
+from app.database.parallel import ParallelRead, fetch_all, run_parallel_reads
+
+
+class DashboardService:
+    """Service class for dashboard operations"""
+
+    async def get_stats(self, session: AsyncSession, today: date, versions: Hashable = None) -> Dict[str, Any]:
+        """
+        Get dashboard statistics, served from the in-process cache when fresh
+
+        Args:
+            session: Read session (the replica when one is configured)
+            today: Day to report attendance for
+            versions: Table versions the caller read; part of the cache key so
+                the cached stats always match the ETag they are sent with
+
+        Returns:
+            Dashboard statistics for the given day
+        """
+        return await dashboard_cache.get_or_load(
+            ("stats", today, versions), lambda: self._load_stats(session, today)
+        )
+
+    async def _load_stats(self, session: AsyncSession, today: date) -> Dict[str, Any]:
+        """
+        Load dashboard statistics in a single round trip
+
+        The employee and attendance counters are one-row aggregates that are
+        LEFT JOINed to today's ten most recent attendance records.
+        """
+        employee_counts = (
+            select(
+                func.count(Employee.id).label("total_employees"),
+                func.count(distinct(Employee.department)).label("active_departments")
+            )
+            .subquery("employee_counts")
+        )
+        attendance_counts = (
+            select(
+                func.count(Attendance.id).filter(
+                    Attendance.status == AttendanceStatus.Present
+                ).label("present_today"),
+                func.count(Attendance.id).filter(
+                    Attendance.status == AttendanceStatus.Absent
+                ).label("absent_today")
+            )
+            .where(Attendance.date == today)
+            .subquery("attendance_counts")
+        )
+        recent = (
+            select(
+                Attendance.id,
+                Attendance.date,
+                Attendance.status,
+                Attendance.created_at,
+                Employee.employee_id,
+                Employee.full_name,
+                Employee.department
+            )
+            .join(Employee, Attendance.employee_id == Employee.employee_id)
+            .where(Attendance.date == today)
+            .order_by(desc(Attendance.created_at))
+            .limit(10)
+            .subquery("recent")
+        )
+
+        result = await session.execute(
+            select(employee_counts, attendance_counts, recent)
+            .select_from(
+                employee_counts
+                .join(attendance_counts, true())
+                .outerjoin(recent, true())
+            )
+            .order_by(desc(recent.c.created_at))
+        )
+        rows = result.all()
+
+        first = rows[0]
+        return {
+            "totalEmployees": first.total_employees or 0,
+            "presentToday": first.present_today or 0,
+            "absentToday": first.absent_today or 0,
+            "activeDepartments": first.active_departments or 0,
+            "recentAttendance": [
+                {
+                    "id": str(row.id),
+                    "employeeId": row.employee_id,
+                    "employeeName": row.full_name,
+                    "department": row.department,
+                    "date": row.date,
+                    "status": row.status.value,
+                    "createdAt": row.created_at
+                }
+                for row in rows
+                if row.id is not None
+            ]
+        }
+
+    async def get_department_stats(
+        self,
+        date_from: date,
+        date_to: date,
+        top_absentees: int = 5
+    ) -> DepartmentAnalyticsResponse:
+        """
+        Get per-department attendance analytics for a period
+
+        Computed in two queries that run concurrently on separate sessions.
+        GROUPING SETS returns each department's totals and its per-week
+        counts from a single pass over employees LEFT JOIN attendance, and a
+        row_number() window picks the top absentees of every department.
+        If the absentee query fails or times out, the totals are returned
+        without absentees and the response is marked partial. Served from
+        the read replica when one is configured.
+
+        Args:
+            date_from: First day of the period
+            date_to: Last day of the period
+            top_absentees: Employees to list per department
+
+        Returns:
+            Analytics for every department, ordered by name
+        """
+        # A literal unit keeps the expression identical in SELECT and GROUP BY
+        week = cast(func.date_trunc(literal_column("'week'"), Attendance.date), Date).label("week")
+        present = func.count(Attendance.id).filter(Attendance.status == AttendanceStatus.Present)
+        absent = func.count(Attendance.id).filter(Attendance.status == AttendanceStatus.Absent)
+        in_period = and_(
+            Attendance.employee_id == Employee.employee_id,
+            Attendance.date >= date_from,
+            Attendance.date <= date_to
+        )
+
+        totals_query = (
+            select(
+                Employee.department,
+                week,
+                func.grouping(week).label("is_total"),
+                func.count(distinct(Employee.employee_id)).label("headcount"),
+                present.label("present"),
+                absent.label("absent")
+            )
+            .outerjoin(Attendance, in_period)
+            .group_by(func.grouping_sets(tuple_(Employee.department), tuple_(Employee.department, week)))
+        )
+
+        absent_days = func.count(Attendance.id)
+        ranked = (
+            select(
+                Employee.department,
+                Employee.employee_id,
+                Employee.full_name,
+                absent_days.label("absent_days"),
+                func.row_number().over(
+                    partition_by=Employee.department,
+                    order_by=(absent_days.desc(), Employee.employee_id)
+                ).label("rank")
+            )
+            .join(Attendance, in_period)
+            .where(Attendance.status == AttendanceStatus.Absent)
+            .group_by(Employee.department, Employee.employee_id, Employee.full_name)
+            .subquery("ranked")
+        )
+        absentees_query = (
+            select(ranked)
+            .where(ranked.c.rank <= top_absentees)
+            .order_by(ranked.c.department, ranked.c.rank)
+        )
+
+        reads = await run_parallel_reads({
+            "department_totals": ParallelRead(fetch_all(totals_query)),
+            "department_absentees": ParallelRead(fetch_all(absentees_query), required=False, fallback=[]),
+        })
+        totals = reads.values["department_totals"]
+        absentees = reads.values["department_absentees"]
+
+        # Every week overlapping the period, so trends have no gaps
+        first_week = date_from - timedelta(days=date_from.weekday())
+        weeks = [first_week + timedelta(weeks=index) for index in range((date_to - first_week).days // 7 + 1)]
+
+        department_totals = {}
+        weekly_counts = {}
+        for row in totals:
+            if row.is_total:
+                department_totals[row.department] = row
+            elif row.week is not None:
+                weekly_counts[(row.department, row.week)] = (row.present, row.absent)
+
+        top_by_department = {}
+        for row in absentees:
+            top_by_department.setdefault(row.department, []).append(
+                DepartmentAbsentee.model_construct(
+                    employeeId=row.employee_id,
+                    fullName=row.full_name,
+                    absentDays=row.absent_days
+                )
+            )
+
+        departments = []
+        for name in sorted(department_totals):
+            row = department_totals[name]
+            trend = []
+            for week_start in weeks:
+                week_present, week_absent = weekly_counts.get((name, week_start), (0, 0))
+                trend.append(DepartmentWeek.model_construct(
+                    weekStart=week_start,
+                    present=week_present,
+                    absent=week_absent,
+                    absenceRate=_rate(week_absent, week_present + week_absent)
+                ))
+            departments.append(DepartmentStats.model_construct(
+                department=name,
+                headcount=row.headcount,
+                present=row.present,
+                absent=row.absent,
+                attendanceRate=_rate(row.present, row.present + row.absent),
+                weeklyTrend=trend,
+                topAbsentees=top_by_department.get(name, [])
+            ))
+
+        return DepartmentAnalyticsResponse.model_construct(
+            dateFrom=date_from,
+            dateTo=date_to,
+            departments=departments,
+            partial=reads.partial
+        )
+
+
+def _rate(part: int, total: int):
+    return round(part / total, 4) if total else None
+
+
+# Service instance
+dashboard_service = DashboardService()
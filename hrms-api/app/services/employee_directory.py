@@ -0,0 +1,135 @@
+"""
+Employee directory
+Cached employee_id -> id/name/department lookups for existence checks,
+kept coherent across workers with LISTEN/NOTIFY or a polled change counter
+"""
+
+import asyncio
+import logging
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import func, select
+
+from app.cache import employee_cache
+from app.config import settings
+from app.database import connection
+from app.database.connection import db
+from app.models.table_version_model import TableVersion
+
+logger = logging.getLogger(__name__)
+
+# Raised by the trg_employees_notify trigger on UPDATE, DELETE and TRUNCATE
+NOTIFY_CHANNEL = "employees_changed"
+
+
+@dataclass(frozen=True)
+class DirectoryEntry:
+    """The employee fields needed by existence checks and labels"""
+    id: uuid.UUID
+    employee_id: str
+    full_name: str
+    department: str
+
+
+class EmployeeDirectory:
+    """
+    Bounded in-process cache of existing employees.
+
+    Only employees that exist are cached, so creating an employee never
+    makes an entry stale. Updates and deletes in this worker drop the entry
+    directly; those in other workers arrive as a NOTIFY on a dedicated
+    connection, which clears the cache. Where LISTEN is not available
+    (psycopg, or a transaction-mode PgBouncer) the employees change counter
+    is polled instead, so entries can be stale for up to
+    EMPLOYEE_CACHE_POLL_INTERVAL seconds.
+    """
+
+    def __init__(self):
+        self._watch_task: Optional[asyncio.Task] = None
+
+    @property
+    def generation(self) -> int:
+        """Pass to add() for entries loaded after reading this"""
+        return employee_cache.generation
+
+    def get(self, employee_id: str) -> Optional[DirectoryEntry]:
+        """Return the cached entry for employee_id, or None if not cached"""
+        return employee_cache.get(employee_id)
+
+    def add(self, entry: DirectoryEntry, generation: int) -> None:
+        """Cache an entry loaded from the database after reading generation"""
+        employee_cache.set(entry.employee_id, entry, generation)
+
+    def discard(self, employee_id: str) -> None:
+        """Drop an employee that was changed or deleted by this worker"""
+        employee_cache.discard(employee_id)
+
+    def start(self) -> None:
+        """Start watching for employee changes made by other workers"""
+        if settings.employee_cache_size > 0 and connection.engine is not None and self._watch_task is None:
+            self._watch_task = asyncio.create_task(self._watch())
+
+    async def stop(self) -> None:
+        if self._watch_task:
+            self._watch_task.cancel()
+            try:
+                await self._watch_task
+            except asyncio.CancelledError:
+                pass
+            self._watch_task = None
+
+    async def _watch(self):
+        interval = settings.employee_cache_poll_interval
+        use_listen = connection.engine.dialect.driver == "asyncpg" and settings.db_pool_mode == "queue"
+        while True:
+            try:
+                if use_listen:
+                    await self._listen(interval)
+                else:
+                    await self._poll(interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Changes may have been missed while disconnected
+                logger.warning(f"Employee directory watcher failed, retrying: {e}")
+                employee_cache.invalidate()
+                await asyncio.sleep(interval)
+
+    async def _listen(self, interval: float):
+        """Hold a connection with LISTEN until it is lost"""
+        async with connection.engine.connect() as conn:
+            raw_connection = await conn.get_raw_connection()
+            listener = raw_connection.driver_connection
+            await listener.add_listener(NOTIFY_CHANNEL, self._on_notify)
+            # Anything changed before LISTEN took effect
+            employee_cache.invalidate()
+            try:
+                while not listener.is_closed():
+                    await asyncio.sleep(interval)
+            finally:
+                if not listener.is_closed():
+                    await listener.remove_listener(NOTIFY_CHANNEL, self._on_notify)
+        raise ConnectionError("LISTEN connection closed")
+
+    def _on_notify(self, conn, pid, channel, payload):
+        employee_cache.invalidate()
+
+    async def _poll(self, interval: float):
+        """Clear the cache whenever the employees change counter moves"""
+        last_version = None
+        while True:
+            async with db.get_session() as session:
+                version = await session.scalar(
+                    select(func.sum(TableVersion.version)).where(TableVersion.table_name == "employees")
+                )
+            if version != last_version:
+                if last_version is not None:
+                    employee_cache.invalidate()
+                last_version = version
+            await asyncio.sleep(interval)
+
+
+# Directory instance
+employee_directory = EmployeeDirectory()
@@ -3,114 +3,167 @@ Employee service layer
 Handles business logic for employee operations
 """
 
-from typing import List
-from sqlalchemy import select, func, Integer
-from sqlalchemy.exc import IntegrityError
+import uuid
+from typing import List, Optional
+from sqlalchemy import select, delete, func, literal
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
-from app.models.employee import EmployeeCreate, EmployeeResponse, EmployeeDeleteResponse
+from app.models.employee import (
+    EmployeeCreate,
+    EmployeeResponse,
+    EmployeeListResponse,
+    EmployeeDeleteResponse,
+)
 from app.models.employee_model import Employee
-from app.models.attendance_model import Attendance, AttendanceStatus
-from app.database.connection import db
+from app.models.attendance_summary_model import AttendanceSummary
+from app.database.unit_of_work import after_commit
+from app.cache import dashboard_cache
+from app.responses import sparse_items
+from app.services.employee_directory import employee_directory
+
+# Generated IDs only collide with manually chosen EMP numbers, so a few retries suffice
+MAX_GENERATED_ID_ATTEMPTS = 5
 
 
 class EmployeeService:
     """Service class for employee operations"""
 
-    async def _generate_employee_id(self, session) -> str:
-        """Generate a unique employee ID in format EMP001, EMP002, etc."""
-        result = await session.execute(
-            select(func.max(func.cast(func.substr(Employee.employee_id, 4), Integer)))
-            .where(Employee.employee_id.like('EMP%'))
-        )
-        max_num = result.scalar() or 0
-        next_num = max_num + 1
-        return f"EMP{next_num:03d}"
-
-    async def create_employee(self, employee_data: EmployeeCreate) -> EmployeeResponse:
+    async def create_employee(self, session: AsyncSession, employee_data: EmployeeCreate) -> EmployeeResponse:
         """
         Create a new employee
 
+        Duplicate IDs are detected by the unique constraint rather than a
+        pre-insert lookup: a single INSERT ... ON CONFLICT DO NOTHING ...
+        RETURNING that returns no row when the ID is taken. When no
+        employee ID is given, the database assigns the next EMP number from
+        employee_id_seq, which is safe under concurrent creates. If that
+        number was already taken by a manually chosen ID, the insert is
+        retried with the next one in the same transaction, on the same
+        connection.
+
         Args:
+            session: The unit of work's session
             employee_data: Employee creation data
 
         Returns:
             Created employee response
+
+        Raises:
+            ValueError: If the employee ID already exists
         """
-        async with db.get_session() as session:
-            try:
-                employee_id = employee_data.employeeId
-                if not employee_id:
-                    employee_id = await self._generate_employee_id(session)
-
-                existing = await session.execute(
-                    select(Employee).where(Employee.employee_id == employee_id)
-                )
-                if existing.scalar_one_or_none():
-                    raise ValueError("Employee ID already exists")
+        values = {
+            "id": uuid.uuid4(),
+            "full_name": employee_data.fullName,
+            "email": employee_data.email,
+            "department": employee_data.department
+        }
+        if employee_data.employeeId:
+            values["employee_id"] = employee_data.employeeId
+
+        # id is generated client-side; employee_id (next_employee_id() on
+        # every execution) and created_at come back via RETURNING. A taken
+        # ID inserts nothing instead of aborting the transaction.
+        insert_stmt = (
+            pg_insert(Employee)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=["employee_id"])
+            .returning(Employee.employee_id, Employee.created_at)
+        )
 
-                employee = Employee(
-                    employee_id=employee_id,
-                    full_name=employee_data.fullName,
+        attempts = 1 if employee_data.employeeId else MAX_GENERATED_ID_ATTEMPTS
+        for _ in range(attempts):
+            result = await session.execute(insert_stmt)
+            row = result.first()
+            if row is not None:
+                after_commit(session, dashboard_cache.invalidate)
+                return EmployeeResponse(
+                    id=str(values["id"]),
+                    employeeId=row.employee_id,
+                    fullName=employee_data.fullName,
                     email=employee_data.email,
-                    department=employee_data.department
+                    department=employee_data.department,
+                    createdAt=row.created_at
                 )
 
-                session.add(employee)
-                await session.commit()
-                await session.refresh(employee)
-
-                return EmployeeResponse(
-                    id=str(employee.id),
-                    employeeId=employee.employee_id,
-                    fullName=employee.full_name,
-                    email=employee.email,
-                    department=employee.department,
-                    createdAt=employee.created_at
-                )
+        raise ValueError("Employee ID already exists")
+
+    async def get_all_employees(
+        self,
+        session: AsyncSession,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        department: Optional[str] = None,
+        name: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> EmployeeListResponse:
+        """
+        Get a page of employees with their total present days count
 
-            except IntegrityError:
-                await session.rollback()
-                raise ValueError("Employee ID already exists")
+        Present days are read from the trigger-maintained attendance_summary
+        table. Uses keyset pagination on employee_id, so the cost of a page depends
+        on the page size and not on the total number of employees.
 
-    async def get_all_employees(self) -> List[EmployeeResponse]:
-        """
-        Get all employees with their total present days count
+        Args:
+            session: Read session (the replica when one is configured)
+            limit: Maximum number of employees to return
+            cursor: employee_id of the last employee on the previous page
+            department: Only return employees in this department
+            name: Only return employees whose name contains this text (case-insensitive)
+            fields: Only return these fields of each employee (all when None)
 
         Returns:
-            List of all employees
+            Page of employees and the cursor for the next page
         """
-        async with db.get_session() as session:
-            # Subquery to count present days
-            present_subquery = (
-                select(func.count(Attendance.id))
-                .where(Attendance.employee_id == Employee.employee_id)
-                .where(Attendance.status == AttendanceStatus.Present)
-                .label("present_count")
+        if fields is not None and "presentCount" not in fields:
+            # Skip the summary join when present counts are not returned
+            query = select(Employee, literal(0))
+        else:
+            query = (
+                select(Employee, func.coalesce(AttendanceSummary.present_count, 0))
+                .outerjoin(AttendanceSummary, AttendanceSummary.employee_id == Employee.employee_id)
             )
+        if cursor:
+            query = query.where(Employee.employee_id > cursor)
+        if department:
+            query = query.where(Employee.department == department)
+        if name:
+            query = query.where(Employee.full_name.icontains(name, autoescape=True))
+
+        # Fetch one extra row to know whether another page exists
+        result = await session.execute(
+            query.order_by(Employee.employee_id).limit(limit + 1)
+        )
+        rows = result.all()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
 
-            result = await session.execute(
-                select(Employee, present_subquery)
+        # Rows come straight from the database, so skip re-validation
+        items = [
+            EmployeeResponse.model_construct(
+                id=str(emp.id),
+                employeeId=emp.employee_id,
+                fullName=emp.full_name,
+                email=emp.email,
+                department=emp.department,
+                createdAt=emp.created_at,
+                presentCount=present_count
             )
-            rows = result.all()
-
-            return [
-                EmployeeResponse(
-                    id=str(emp.id),
-                    employeeId=emp.employee_id,
-                    fullName=emp.full_name,
-                    email=emp.email,
-                    department=emp.department,
-                    createdAt=emp.created_at,
-                    presentCount=present_count
-                )
-                for emp, present_count in rows
-            ]
+            for emp, present_count in rows
+        ]
+
+        return EmployeeListResponse.model_construct(
+            items=sparse_items(items, fields) if fields else items,
+            nextCursor=rows[-1][0].employee_id if has_more else None
+        )
 
-    async def get_employee_by_id(self, employee_id: str) -> EmployeeResponse:
+    async def get_employee_by_id(self, session: AsyncSession, employee_id: str) -> EmployeeResponse:
         """
         Get employee by employee ID (e.g., EMP001) with present days count
         
         Args:
+            session: Read session (the replica when one is configured)
             employee_id: Employee identifier (e.g., EMP001)
             
         Returns:
@@ -119,39 +172,35 @@ class EmployeeService:
         Raises:
             ValueError: If employee not found
         """
-        async with db.get_session() as session:
-            # Subquery to count present days
-            present_subquery = (
-                select(func.count(Attendance.id))
-                .where(Attendance.employee_id == employee_id)
-                .where(Attendance.status == AttendanceStatus.Present)
-                .label("present_count")
-            )
-
-            result = await session.execute(
-                select(Employee, present_subquery)
-                .where(Employee.employee_id == employee_id)
-            )
-            row = result.first()
-            if not row:
-                raise ValueError("Employee not found")
-
-            emp, present_count = row
-            return EmployeeResponse(
-                id=str(emp.id),
-                employeeId=emp.employee_id,
-                fullName=emp.full_name,
-                email=emp.email,
-                department=emp.department,
-                createdAt=emp.created_at,
-                presentCount=present_count
-            )
+        result = await session.execute(
+            select(Employee, func.coalesce(AttendanceSummary.present_count, 0))
+            .outerjoin(AttendanceSummary, AttendanceSummary.employee_id == Employee.employee_id)
+            .where(Employee.employee_id == employee_id)
+        )
+        row = result.first()
+        if not row:
+            raise ValueError("Employee not found")
+
+        emp, present_count = row
+        return EmployeeResponse.model_construct(
+            id=str(emp.id),
+            employeeId=emp.employee_id,
+            fullName=emp.full_name,
+            email=emp.email,
+            department=emp.department,
+            createdAt=emp.created_at,
+            presentCount=present_count
+        )
 
-    async def delete_employee(self, employee_id: str) -> EmployeeDeleteResponse:
+    async def delete_employee(self, session: AsyncSession, employee_id: str) -> EmployeeDeleteResponse:
         """
         Delete an employee
 
+        A single DELETE ... RETURNING; the database cascades to the
+        employee's attendance records.
+
         Args:
+            session: The unit of work's session
             employee_id: Employee identifier (e.g., EMP001) to delete
 
         Returns:
@@ -160,22 +209,21 @@ class EmployeeService:
         Raises:
             ValueError: If employee not found
         """
-        async with db.get_session() as session:
-            employee = await session.execute(
-                select(Employee).where(Employee.employee_id == employee_id)
-            )
-            employee = employee.scalar_one_or_none()
-            if not employee:
-                raise ValueError("Employee not found")
+        deleted_id = await session.scalar(
+            delete(Employee)
+            .where(Employee.employee_id == employee_id)
+            .returning(Employee.employee_id)
+        )
+        if deleted_id is None:
+            raise ValueError("Employee not found")
 
-            employee_id_str = employee.employee_id
-            await session.delete(employee)
-            await session.commit()
+        after_commit(session, lambda: employee_directory.discard(deleted_id))
+        after_commit(session, dashboard_cache.invalidate)
 
-            return EmployeeDeleteResponse(
-                message="Employee deleted successfully",
-                employeeId=employee_id_str
-            )
+        return EmployeeDeleteResponse(
+            message="Employee deleted successfully",
+            employeeId=deleted_id
+        )
 
 
 # Service instance
@@ -0,0 +1,34 @@
+"""
+Service layer exceptions
+Typed errors raised by services so routes can map them to status codes
+without inspecting messages. They subclass ValueError, which routes
+already treat as a client error.
+"""
+
+
+class EmployeeNotFoundError(ValueError):
+    """The referenced employee does not exist"""
+
+    def __init__(self, message: str = "Employee not found"):
+        super().__init__(message)
+
+
+class AttendanceConflictError(ValueError):
+    """Attendance is already marked for the employee and date with a different status"""
+
+    def __init__(self, message: str = "Attendance already marked for this employee on this date"):
+        super().__init__(message)
+
+
+class IdempotencyKeyReusedError(ValueError):
+    """An idempotency key was sent again with a different request"""
+
+    def __init__(self, message: str = "Idempotency key was already used with a different request"):
+        super().__init__(message)
+
+
+class InvalidAttendanceDateError(ValueError):
+    """Attendance cannot be marked for the given date"""
+
+    def __init__(self, message: str = "Cannot mark attendance for future dates"):
+        super().__init__(message)
@@ -0,0 +1,190 @@
+"""
+Import service layer
+Loads employees and attendance in bulk, for staging refreshes and migrations
+"""
+
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.connection import db
+
+EMPLOYEE_COLUMNS = ("employee_id", "full_name", "email", "department")
+ATTENDANCE_COLUMNS = ("employee_id", "date", "status")
+MAX_GENERATED_ID_ATTEMPTS = 5
+
+# Only ever moves the sequence forward, so concurrent batches cannot rewind it
+SYNC_SEQUENCE_SQL = (
+    "SELECT setval('employee_id_seq', GREATEST(COALESCE("
+    "(SELECT MAX(CAST(SUBSTR(employee_id, 4) AS BIGINT)) FROM employees "
+    "WHERE employee_id ~ '^EMP[0-9]+$'), 0) + 1, nextval('employee_id_seq')), false)"
+)
+
+
+@dataclass
+class EmployeeImportResult:
+    """
+    Outcome of one employee import batch
+
+    Attributes:
+        created: Employee IDs of the employees that were created
+        conflicts: Explicit employee IDs that already belong to a different
+            employee (different name, email or department); not imported
+    """
+    created: List[str]
+    conflicts: List[str]
+
+
+class ImportService:
+    """Service class for bulk imports"""
+
+    async def import_employees(self, rows: Sequence[Tuple]) -> EmployeeImportResult:
+        """
+        Import a batch of employees
+
+        Rows are copied into a temporary staging table. Rows with an employee
+        ID are inserted first and the ID sequence is moved past them, so a
+        generated ID can never take an ID from the file; rows without one
+        then get generated IDs (retried with new ones if an ID turns out to
+        be taken). An explicit ID that already exists with the same name,
+        email and department is skipped, so imports can be re-run; one that
+        belongs to a different employee is reported as a conflict.
+
+        Args:
+            rows: (employee_id or None, full_name, email, department) tuples
+
+        Returns:
+            Created employee IDs and conflicting explicit IDs
+
+        Raises:
+            ValueError: If no free ID could be generated for some rows
+        """
+        async with db.get_session() as session:
+            await session.execute(text(
+                "CREATE TEMPORARY TABLE import_employees ("
+                "employee_id VARCHAR(50), full_name VARCHAR(200), "
+                "email VARCHAR(200), department VARCHAR(100), "
+                "pending BOOLEAN NOT NULL DEFAULT false"
+                ") ON COMMIT DROP"
+            ))
+            await self._copy_rows(session, "import_employees", EMPLOYEE_COLUMNS, rows)
+
+            result = await session.execute(text(
+                "INSERT INTO employees (employee_id, full_name, email, department) "
+                "SELECT employee_id, full_name, email, department "
+                "FROM import_employees WHERE employee_id IS NOT NULL "
+                "ON CONFLICT (employee_id) DO NOTHING "
+                "RETURNING employee_id"
+            ))
+            created = list(result.scalars())
+            result = await session.execute(text(
+                "SELECT DISTINCT i.employee_id FROM import_employees i "
+                "JOIN employees e ON e.employee_id = i.employee_id "
+                "WHERE (e.full_name, e.email, e.department) "
+                "IS DISTINCT FROM (i.full_name, i.email, i.department) "
+                "ORDER BY i.employee_id"
+            ))
+            conflicts = list(result.scalars())
+
+            await session.execute(text(SYNC_SEQUENCE_SQL))
+            result = await session.execute(text(
+                "UPDATE import_employees SET employee_id = next_employee_id(), pending = true "
+                "WHERE employee_id IS NULL"
+            ))
+            pending = result.rowcount
+            for _ in range(MAX_GENERATED_ID_ATTEMPTS):
+                if not pending:
+                    break
+                result = await session.execute(text(
+                    "WITH inserted AS ("
+                    "INSERT INTO employees (employee_id, full_name, email, department) "
+                    "SELECT employee_id, full_name, email, department "
+                    "FROM import_employees WHERE pending "
+                    "ON CONFLICT (employee_id) DO NOTHING "
+                    "RETURNING employee_id"
+                    "), done AS ("
+                    "UPDATE import_employees i SET pending = false "
+                    "FROM inserted WHERE i.employee_id = inserted.employee_id"
+                    ") "
+                    "SELECT employee_id FROM inserted"
+                ))
+                created.extend(result.scalars())
+                # IDs taken in the meantime (e.g. created through the API) get new ones
+                result = await session.execute(text(
+                    "UPDATE import_employees SET employee_id = next_employee_id() WHERE pending"
+                ))
+                pending = result.rowcount
+            if pending:
+                raise ValueError(f"Could not generate unique employee IDs for {pending} employees")
+
+            await session.commit()
+            return EmployeeImportResult(created=created, conflicts=conflicts)
+
+    async def import_attendance(self, rows: Sequence[Tuple]) -> int:
+        """
+        Import a batch of attendance records
+
+        Records for unknown employees, future dates, or an employee and date
+        that already has a record are skipped, so re-running an import is safe.
+
+        Args:
+            rows: (employee_id, date, status) tuples, status "Present" or "Absent"
+
+        Returns:
+            Number of records created
+        """
+        async with db.get_session() as session:
+            await session.execute(text(
+                "CREATE TEMPORARY TABLE import_attendance ("
+                "employee_id VARCHAR(50), date DATE, status VARCHAR(10)"
+                ") ON COMMIT DROP"
+            ))
+            await self._copy_rows(session, "import_attendance", ATTENDANCE_COLUMNS, rows)
+            result = await session.execute(text(
+                "INSERT INTO attendance (employee_id, date, status) "
+                "SELECT i.employee_id, i.date, i.status::attendance_status "
+                "FROM import_attendance i "
+                "JOIN employees e ON e.employee_id = i.employee_id "
+                "WHERE i.date <= CURRENT_DATE "
+                "ON CONFLICT (employee_id, date) DO NOTHING"
+            ))
+            await session.commit()
+            return result.rowcount
+
+    async def sync_employee_id_sequence(self) -> None:
+        """
+        Move employee_id_seq past the highest imported EMP<number> ID
+
+        Imported IDs do not advance the sequence, so without this the API
+        would generate IDs that already exist.
+        """
+        async with db.get_session() as session:
+            await session.execute(text(SYNC_SEQUENCE_SQL))
+            await session.commit()
+
+    async def _copy_rows(
+        self,
+        session: AsyncSession,
+        table: str,
+        columns: Sequence[str],
+        rows: Sequence[Tuple]
+    ) -> None:
+        """Load rows into a staging table with COPY, or batched INSERTs on drivers without COPY support"""
+        connection = await session.connection()
+        if connection.dialect.driver == "asyncpg":
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                table, records=rows, columns=list(columns)
+            )
+            return
+
+        placeholders = ", ".join(f":{column}" for column in columns)
+        await session.execute(
+            text(f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"),
+            [dict(zip(columns, row)) for row in rows]
+        )
+
+
+# Service instance
+import_service = ImportService()
@@ -0,0 +1,88 @@
+"""
+Version service layer
+Reads the trigger-maintained table change counters used for ETags
+"""
+
+from typing import Any, Tuple
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.attendance_summary_model import AttendanceSummary
+from app.models.table_version_model import TableVersion
+from app.responses import make_etag
+
+# Every list and stats endpoint reads both tables (present counts come from attendance)
+VERSIONED_TABLES = ("employees", "attendance")
+
+
+class VersionService:
+    """Service class for data version lookups"""
+
+    async def get_versions(self, session: AsyncSession) -> Tuple[int, ...]:
+        """
+        Get the current change counter of every versioned table
+
+        Each counter is the sum of the table's shards. Read on the same session as the endpoint's data, and before it, so a
+        version is never newer than the data it is paired with.
+
+        Args:
+            session: The read endpoint's session
+
+        Returns:
+            Counters in VERSIONED_TABLES order
+        """
+        result = await session.execute(
+            select(TableVersion.table_name, func.sum(TableVersion.version))
+            .where(TableVersion.table_name.in_(VERSIONED_TABLES))
+            .group_by(TableVersion.table_name)
+        )
+        versions = dict(result.all())
+        return tuple(int(versions.get(table, 0)) for table in VERSIONED_TABLES)
+
+    async def get_etag(self, session: AsyncSession, *key_parts: Any) -> Tuple[str, Tuple[int, ...]]:
+        """
+        Get the ETag for a read endpoint
+
+        Args:
+            session: The read endpoint's session
+            key_parts: Endpoint name and every parameter that shapes the response
+
+        Returns:
+            Tuple of (ETag, table versions it was built from)
+        """
+        versions = await self.get_versions(session)
+        return make_etag(versions, *key_parts), versions
+
+    async def get_attendance_etag(self, session: AsyncSession, employee_id: str, *key_parts: Any) -> str:
+        """
+        Get the ETag for one employee's attendance history
+
+        Built from the employee's own attendance version, kept on their
+        attendance_summary row, so marks for other employees do not change
+        it. The employees counter is included because deleting and
+        re-creating an employee restarts their attendance version.
+
+        Args:
+            session: The read endpoint's session
+            employee_id: Employee identifier
+            key_parts: Every other parameter that shapes the response
+
+        Returns:
+            The ETag
+        """
+        employees_version = (
+            select(func.coalesce(func.sum(TableVersion.version), 0))
+            .where(TableVersion.table_name == "employees")
+            .scalar_subquery()
+        )
+        attendance_version = (
+            select(AttendanceSummary.version)
+            .where(AttendanceSummary.employee_id == employee_id)
+            .scalar_subquery()
+        )
+        versions = (await session.execute(select(employees_version, attendance_version))).one()
+        return make_etag(tuple(int(version or 0) for version in versions), "attendance", employee_id, *key_parts)
+
+
+# Service instance
+version_service = VersionService()
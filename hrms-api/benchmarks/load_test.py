@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+API load test
+
+Seeds a throwaway PostgreSQL database with a synthetic company (N employees
+x D days of attendance), starts the application in-process and drives
+concurrent requests at each endpoint through the full middleware stack.
+Reports latency percentiles, throughput and database queries per request
+(from the application's own metrics) as JSON, and optionally compares the
+result against a previous run.
+
+The target database is wiped: point it at a dedicated database, never at
+DATABASE_URL. The services rely on PostgreSQL features (ON CONFLICT,
+statement-level triggers, sequences), so other databases are not supported.
+
+Usage:
+    python benchmarks/load_test.py --database-url postgresql://postgres@localhost/hrms_bench \\
+        [--employees 200] [--days 30] [--concurrency 16] [--requests 400] \\
+        [--output result.json] [--baseline previous.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DEPARTMENTS = ("Engineering", "Sales", "Marketing", "Product", "Finance", "Operations")
+SEED_CHUNK_SIZE = 5000
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Load test the HRMS API against a local PostgreSQL database")
+    parser.add_argument("--database-url", default=os.getenv("BENCH_DATABASE_URL"),
+                        help="Database to wipe and seed (default: BENCH_DATABASE_URL)")
+    parser.add_argument("--schema", default=os.path.join(ROOT, "..", "hrms-db", "schema.sql"),
+                        help="Schema file to load (default: hrms-db/schema.sql)")
+    parser.add_argument("--employees", type=int, default=200, help="Employees to seed")
+    parser.add_argument("--days", type=int, default=30, help="Days of attendance to seed per employee")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent requests per endpoint")
+    parser.add_argument("--requests", type=int, default=400, help="Requests per endpoint")
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    parser.add_argument("--baseline", help="Report from a previous run to compare p95 latency against")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed p95 slowdown against the baseline before failing (default: 0.2 = 20%%)")
+    args = parser.parse_args()
+
+    if not args.database_url:
+        parser.error("--database-url or BENCH_DATABASE_URL is required")
+    if args.database_url == os.getenv("DATABASE_URL"):
+        parser.error("refusing to wipe DATABASE_URL; use a dedicated benchmark database")
+    return args
+
+
+async def reset_database(database_url: str, schema_path: str) -> None:
+    """Drop everything in the public schema and load the schema file"""
+    import asyncpg
+
+    conn = await asyncpg.connect(database_url)
+    try:
+        await conn.execute("DROP SCHEMA public CASCADE; CREATE SCHEMA public;")
+        with open(schema_path) as schema:
+            await conn.execute(schema.read())
+    finally:
+        await conn.close()
+
+
+async def seed(employees: int, days: int) -> dict:
+    """
+    Insert the synthetic company through the SQLAlchemy models
+
+    Attendance covers the `days` days before today, so today and older
+    dates stay free for the mark phase.
+    """
+    from sqlalchemy import insert, select
+
+    from app.database.connection import db
+    from app.models.attendance_model import Attendance, AttendanceStatus
+    from app.models.employee_model import Employee
+
+    rng = random.Random(42)
+    start = time.perf_counter()
+
+    async with db.get_session() as session:
+        await session.execute(insert(Employee), [
+            {
+                "full_name": f"Employee {index}",
+                "email": f"employee{index}@example.com",
+                "department": DEPARTMENTS[index % len(DEPARTMENTS)],
+            }
+            for index in range(employees)
+        ])
+        await session.commit()
+        employee_ids = list((await session.execute(
+            select(Employee.employee_id).order_by(Employee.employee_id)
+        )).scalars())
+
+    today = date.today()
+    rows = [
+        {
+            "employee_id": employee_id,
+            "date": today - timedelta(days=offset),
+            "status": AttendanceStatus.Present if rng.random() < 0.9 else AttendanceStatus.Absent,
+        }
+        for employee_id in employee_ids
+        for offset in range(1, days + 1)
+    ]
+    async with db.get_session() as session:
+        for index in range(0, len(rows), SEED_CHUNK_SIZE):
+            await session.execute(insert(Attendance), rows[index:index + SEED_CHUNK_SIZE])
+        await session.commit()
+
+    return {
+        "employees": len(employee_ids),
+        "attendance": len(rows),
+        "seconds": round(time.perf_counter() - start, 3),
+        "employee_ids": employee_ids,
+    }
+
+
+async def call(app, method: str, path: str, body: bytes = b"") -> int:
+    """Run one request through the ASGI interface and return the status code"""
+    raw_path, _, query = path.partition("?")
+    headers = [(b"host", b"bench"), (b"accept-encoding", b"gzip")]
+    if body:
+        headers += [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": raw_path,
+        "raw_path": raw_path.encode(),
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    status_code = 0
+    body_sent = False
+
+    async def receive():
+        nonlocal body_sent
+        if body_sent:
+            # Nothing more to read; wait like a client that keeps the connection open
+            await asyncio.Event().wait()
+        body_sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+
+    await app(scope, receive, send)
+    return status_code
+
+
+def percentile(sorted_values, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def query_totals(method: str, route: str):
+    """Summed queries and request count recorded by MetricsMiddleware for a route"""
+    from app.metrics import request_db_queries
+
+    total = 0.0
+    count = 0
+    for (series_method, series_route), (_, series_sum, series_count) in request_db_queries._series.items():
+        if series_method == method and series_route == route:
+            total += series_sum
+            count += series_count
+    return total, count
+
+
+async def run_endpoint(app, method: str, route: str, make_request, requests: int, concurrency: int) -> dict:
+    """Send `requests` requests with `concurrency` in flight and summarize them"""
+    latencies = []
+    errors = 0
+    next_index = 0
+
+    async def worker():
+        nonlocal errors, next_index
+        while next_index < requests:
+            index = next_index
+            next_index += 1
+            path, body = make_request(index)
+            start = time.perf_counter()
+            status_code = await call(app, method, path, body)
+            latencies.append(time.perf_counter() - start)
+            if status_code >= 400:
+                errors += 1
+
+    queries_before, count_before = query_totals(method, route)
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    queries_after, count_after = query_totals(method, route)
+
+    latencies.sort()
+    observed = count_after - count_before
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1),
+        "latency_ms": {
+            "p50": round(percentile(latencies, 0.50) * 1000, 2),
+            "p95": round(percentile(latencies, 0.95) * 1000, 2),
+            "p99": round(percentile(latencies, 0.99) * 1000, 2),
+            "max": round(latencies[-1] * 1000, 2),
+        },
+        "queries_per_request": round((queries_after - queries_before) / observed, 2) if observed else None,
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list:
+    """Endpoints whose p95 latency got worse than the baseline by more than tolerance"""
+    regressions = []
+    for name, result in report["endpoints"].items():
+        previous = baseline.get("endpoints", {}).get(name)
+        if not previous:
+            continue
+        before = previous["latency_ms"]["p95"]
+        after = result["latency_ms"]["p95"]
+        if before and after > before * (1 + tolerance):
+            regressions.append(f"{name}: p95 {before} ms -> {after} ms")
+    return regressions
+
+
+async def main():
+    args = parse_args()
+
+    # The app reads its configuration at import time
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("DB_SSLMODE", "disable")
+    os.environ.setdefault("ENVIRONMENT", "benchmark")
+
+    await reset_database(args.database_url, args.schema)
+
+    from main import app
+    from app.database.connection import db
+
+    await db.connect()
+    try:
+        seeded = await seed(args.employees, args.days)
+        employee_ids = seeded.pop("employee_ids")
+        rng = random.Random(7)
+        # Mark dates older than the seeded range, so every mark is a new record
+        first_free_day = date.today() - timedelta(days=args.days + 1)
+
+        def mark(index):
+            record = {
+                "employeeId": employee_ids[index % len(employee_ids)],
+                "date": str(first_free_day - timedelta(days=index // len(employee_ids))),
+                "status": "Present",
+            }
+            return "/api/attendance", json.dumps(record).encode()
+
+        endpoints = [
+            ("list", "GET", "/api/employees", lambda index: ("/api/employees?limit=50", b"")),
+            ("detail", "GET", "/api/employees/{employee_id}",
+             lambda index: (f"/api/employees/{rng.choice(employee_ids)}", b"")),
+            ("mark", "POST", "/api/attendance", mark),
+            ("history", "GET", "/api/attendance/{employee_id}",
+             lambda index: (f"/api/attendance/{rng.choice(employee_ids)}", b"")),
+            ("dashboard", "GET", "/api/dashboard/stats", lambda index: ("/api/dashboard/stats", b"")),
+        ]
+
+        report = {
+            "config": {
+                "employees": args.employees,
+                "days": args.days,
+                "concurrency": args.concurrency,
+                "requests": args.requests,
+            },
+            "seed": seeded,
+            "endpoints": {},
+        }
+        for name, method, route, make_request in endpoints:
+            report["endpoints"][name] = await run_endpoint(
+                app, method, route, make_request, args.requests, args.concurrency
+            )
+    finally:
+        await db.disconnect()
+
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as report_file:
+            report_file.write(output + "\n")
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            regressions = compare(report, json.load(baseline_file), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
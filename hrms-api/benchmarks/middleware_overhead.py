@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Error middleware overhead benchmark
+
+Measures the per-request cost of ErrorHandlerMiddleware against the previous
+BaseHTTPMiddleware implementation and against no middleware at all. Requests
+are driven straight through the ASGI interface (no network, no HTTP client),
+so the numbers isolate the middleware itself.
+
+Usage:
+    python benchmarks/middleware_overhead.py [requests]
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.middleware.error_handler import ErrorHandlerMiddleware
+
+
+class BaseHTTPErrorHandlerMiddleware(BaseHTTPMiddleware):
+    """The previous implementation, reduced to its request path"""
+    async def dispatch(self, request, call_next):
+        try:
+            return await call_next(request)
+        except Exception:
+            raise
+
+
+def build_app(middleware=None) -> FastAPI:
+    app = FastAPI()
+    if middleware:
+        app.add_middleware(middleware)
+
+    @app.get("/ping")
+    async def ping():
+        return {"status": "ok"}
+
+    return app
+
+
+async def run(app: FastAPI, requests: int) -> float:
+    """Send requests sequentially and return mean microseconds per request"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/ping",
+        "raw_path": b"/ping",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+    disconnected = asyncio.Event()
+
+    def make_receive():
+        sent = False
+
+        async def receive():
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            # Like a real server: block until the client goes away
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        return receive
+
+    async def send(message):
+        pass
+
+    # Warm up routing and middleware stack construction
+    for _ in range(200):
+        await app(dict(scope), make_receive(), send)
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), make_receive(), send)
+    return (time.perf_counter() - start) / requests * 1_000_000
+
+
+async def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    baseline = await run(build_app(), requests)
+    legacy = await run(build_app(BaseHTTPErrorHandlerMiddleware), requests)
+    current = await run(build_app(ErrorHandlerMiddleware), requests)
+
+    print(f"Requests per variant: {requests}")
+    print(f"{'variant':<28}{'us/request':>12}{'overhead us':>14}")
+    for name, value in (
+        ("no middleware", baseline),
+        ("BaseHTTPMiddleware (before)", legacy),
+        ("pure ASGI (after)", current),
+    ):
+        print(f"{name:<28}{value:>12.1f}{value - baseline:>14.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+List endpoint serialization benchmark
+
+Compares the previous response path for GET /api/employees (one validated
+EmployeeResponse per row, re-validated against response_model and encoded
+with the stdlib JSON encoder) with the fast path (model_construct on trusted
+rows rendered by ORJSONResponse). Rows are generated in memory so the
+numbers exclude the database.
+
+Usage:
+    python benchmarks/serialization.py [employees] [iterations]
+"""
+
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI
+
+from app.models.employee import EmployeeListResponse, EmployeeResponse
+from app.responses import ORJSONResponse
+
+
+def make_rows(count: int):
+    now = datetime.now(timezone.utc)
+    return [
+        (
+            SimpleNamespace(
+                id=uuid.uuid4(),
+                employee_id=f"EMP{index:05d}",
+                full_name=f"Employee {index}",
+                email=f"employee{index}@example.com",
+                department=("Engineering", "Sales", "Marketing", "Product")[index % 4],
+                created_at=now,
+            ),
+            index % 200,
+        )
+        for index in range(count)
+    ]
+
+
+def build_app(rows) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/validated", response_model=EmployeeListResponse)
+    async def validated():
+        return EmployeeListResponse(
+            items=[
+                EmployeeResponse(
+                    id=str(emp.id),
+                    employeeId=emp.employee_id,
+                    fullName=emp.full_name,
+                    email=emp.email,
+                    department=emp.department,
+                    createdAt=emp.created_at,
+                    presentCount=present_count
+                )
+                for emp, present_count in rows
+            ],
+            nextCursor=None
+        )
+
+    @app.get("/fast", response_model=EmployeeListResponse)
+    async def fast():
+        return ORJSONResponse(EmployeeListResponse.model_construct(
+            items=[
+                EmployeeResponse.model_construct(
+                    id=str(emp.id),
+                    employeeId=emp.employee_id,
+                    fullName=emp.full_name,
+                    email=emp.email,
+                    department=emp.department,
+                    createdAt=emp.created_at,
+                    presentCount=present_count
+                )
+                for emp, present_count in rows
+            ],
+            nextCursor=None
+        ))
+
+    return app
+
+
+async def call(app: FastAPI, path: str) -> int:
+    """Run one request through the ASGI interface and return the body size"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    size = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal size
+        if message["type"] == "http.response.body":
+            size += len(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return size
+
+
+async def measure(app: FastAPI, path: str, iterations: int):
+    await call(app, path)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        size = await call(app, path)
+    latency = (time.perf_counter() - start) / iterations * 1000
+
+    tracemalloc.start()
+    await call(app, path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return latency, peak / 1024 / 1024, size
+
+
+async def main():
+    employees = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    app = build_app(make_rows(employees))
+
+    print(f"Employees per response: {employees}, iterations: {iterations}")
+    print(f"{'path':<34}{'ms/request':>12}{'peak MiB':>10}{'bytes':>10}")
+    for name, path in (
+        ("validated + stdlib json (before)", "/validated"),
+        ("model_construct + orjson (after)", "/fast"),
+    ):
+        latency, peak, size = await measure(app, path, iterations)
+        print(f"{name:<34}{latency:>12.1f}{peak:>10.1f}{size:>10}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Bulk import employees and attendance
+
+Loads employee and attendance records from CSV, JSON or NDJSON files (for
+example an export from another HR system), or generates a synthetic company.
+Records are written either straight to the database from DATABASE_URL
+(COPY into a staging table, several batches in parallel) or through a
+running API over HTTP with a bounded number of keep-alive connections.
+Progress is reported in rows per second.
+
+Files use the API field names: employees need fullName, email and department
+(employeeId is optional and generated when missing); attendance needs
+employeeId, date (YYYY-MM-DD) and status (Present or Absent). Employees
+with an employeeId are loaded before those without, so a generated ID never
+takes an ID from the file. Existing employees (same ID, name, email and
+department) and existing attendance records are skipped, so an import can
+be re-run; IDs that already belong to a different employee are reported.
+
+Usage:
+    python import_data.py --employees employees.csv --attendance attendance.csv
+    python import_data.py --synthetic-employees 100000 --synthetic-days 365
+    python import_data.py --synthetic-employees 50 --http http://localhost:8000
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import random
+import time
+from datetime import date, timedelta
+from typing import Awaitable, Callable, Dict, Iterable, Iterator, List
+
+DEPARTMENTS = ["Engineering", "Sales", "Human Resources", "Marketing", "Product"]
+BULK_MAX_RECORDS = 5000  # Max records accepted by POST /api/attendance/bulk
+HTTP_MAX_ATTEMPTS = 6  # Tries per request while the API answers 503 (busy or timed out)
+
+
+class Progress:
+    """Prints a running row count and rate, at most twice a second"""
+
+    def __init__(self, label: str):
+        self.label = label
+        self.rows = 0
+        self.written = 0
+        self.start = time.perf_counter()
+        self._last_print = 0.0
+
+    def add(self, rows: int, written: int) -> None:
+        self.rows += rows
+        self.written += written
+        now = time.perf_counter()
+        if now - self._last_print >= 0.5:
+            self._last_print = now
+            print(f"\r{self._line()}", end="", flush=True)
+
+    def finish(self) -> None:
+        print(f"\r{self._line()}")
+
+    def _line(self) -> str:
+        elapsed = max(time.perf_counter() - self.start, 1e-9)
+        return (
+            f"{self.label}: {self.rows:,} rows read, {self.written:,} written "
+            f"({self.rows / elapsed:,.0f} rows/s, {elapsed:.1f}s)"
+        )
+
+
+def read_records(path: str) -> Iterator[Dict]:
+    """Yield records from a .csv, .json (array) or .ndjson/.jsonl file"""
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, newline="", encoding="utf-8") as source:
+        if extension == ".csv":
+            yield from csv.DictReader(source)
+        elif extension in (".ndjson", ".jsonl"):
+            for line in source:
+                if line.strip():
+                    yield json.loads(line)
+        elif extension == ".json":
+            yield from json.load(source)
+        else:
+            raise SystemExit(f"Unsupported file type: {path} (use .csv, .json, .ndjson or .jsonl)")
+
+
+def batched(records: Iterable, size: int) -> Iterator[List]:
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def synthetic_employees(count: int) -> Iterator[Dict]:
+    for index in range(count):
+        yield {
+            "fullName": f"Employee {index + 1}",
+            "email": f"employee{index + 1}@example.com",
+            "department": DEPARTMENTS[index % len(DEPARTMENTS)],
+        }
+
+
+def synthetic_attendance(employee_ids: List[str], days: int, weekends: bool) -> Iterator[Dict]:
+    """Attendance for the given number of days up to yesterday, 90% present"""
+    rng = random.Random(42)
+    end = date.today() - timedelta(days=1)
+    dates = [end - timedelta(days=offset) for offset in range(days)]
+    if not weekends:
+        dates = [day for day in dates if day.weekday() < 5]
+    for employee_id in employee_ids:
+        for day in dates:
+            yield {
+                "employeeId": employee_id,
+                "date": day.isoformat(),
+                "status": "Present" if rng.random() < 0.9 else "Absent",
+            }
+
+
+async def run_batches(
+    batches: Iterator[List],
+    handler: Callable[[List], Awaitable[int]],
+    concurrency: int,
+    progress: Progress
+) -> None:
+    """
+    Run handler on each batch with at most `concurrency` batches in flight
+
+    Batches are produced lazily, so only the batches in flight are held in
+    memory. The first failing batch stops the import.
+    """
+    slots = asyncio.Semaphore(concurrency)
+    pending = set()
+
+    async def run(batch: List):
+        try:
+            progress.add(len(batch), await handler(batch))
+        finally:
+            slots.release()
+
+    try:
+        for batch in batches:
+            await slots.acquire()
+            for task in [task for task in pending if task.done()]:
+                pending.discard(task)
+                task.result()  # Re-raise a failed batch
+            pending.add(asyncio.create_task(run(batch)))
+        await asyncio.gather(*pending)
+    finally:
+        for task in pending:
+            task.cancel()
+    progress.finish()
+
+
+class DatabaseTarget:
+    """Writes batches directly through the SQLAlchemy layer"""
+
+    def __init__(self, batch_size: int):
+        self.batch_size = batch_size
+        self.employee_ids: List[str] = []
+        self.conflicts: List[str] = []
+
+    async def __aenter__(self):
+        from app.database.connection import db
+        from app.services.import_service import import_service
+
+        self.db = db
+        self.import_service = import_service
+        await db.connect()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.db.disconnect()
+
+    async def write_employees(self, batch: List[Dict]) -> int:
+        result = await self.import_service.import_employees([
+            (record.get("employeeId") or None, record["fullName"], record["email"], record["department"])
+            for record in batch
+        ])
+        self.employee_ids.extend(result.created)
+        self.conflicts.extend(result.conflicts)
+        return len(result.created)
+
+    async def finish_employees(self) -> None:
+        await self.import_service.sync_employee_id_sequence()
+
+    async def write_attendance(self, batch: List[Dict]) -> int:
+        return await self.import_service.import_attendance([
+            (record["employeeId"], date.fromisoformat(record["date"]), record["status"])
+            for record in batch
+        ])
+
+
+class HttpTarget:
+    """Writes through a running API with a pool of keep-alive connections"""
+
+    def __init__(self, base_url: str, concurrency: int):
+        self.base_url = base_url.rstrip("/")
+        self.concurrency = concurrency
+        self.batch_size = BULK_MAX_RECORDS
+        self.employee_ids: List[str] = []
+        self.conflicts: List[str] = []
+
+    async def __aenter__(self):
+        try:
+            import httpx
+        except ImportError:
+            raise SystemExit("HTTP imports need httpx: pip install httpx")
+
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=120,
+            limits=httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.client.aclose()
+
+    async def request(self, method: str, url: str, **kwargs):
+        """
+        Send a request, retrying while the API sheds load
+
+        A 503 (admission control or a statement timeout) means nothing was
+        written, so the request is sent again after Retry-After, waiting
+        longer each time. The last response is returned either way.
+        """
+        for attempt in range(1, HTTP_MAX_ATTEMPTS + 1):
+            response = await self.client.request(method, url, **kwargs)
+            if response.status_code != 503 or attempt == HTTP_MAX_ATTEMPTS:
+                return response
+            try:
+                retry_after = float(response.headers.get("Retry-After", 1))
+            except ValueError:
+                retry_after = 1
+            await asyncio.sleep(retry_after * attempt)
+
+    async def write_employees(self, batch: List[Dict]) -> int:
+        created = 0
+        for record in batch:
+            payload = {key: record[key] for key in ("fullName", "email", "department")}
+            if record.get("employeeId"):
+                payload["employeeId"] = record["employeeId"]
+            response = await self.request("POST", "/api/employees", json=payload)
+            if response.status_code == 201:
+                self.employee_ids.append(response.json()["employeeId"])
+                created += 1
+            elif response.status_code == 409 and "employeeId" in payload:
+                # Already imported by an earlier run, unless the ID belongs to someone else
+                existing = await self.request("GET", f"/api/employees/{payload['employeeId']}")
+                if existing.status_code != 200 or any(
+                    existing.json()[key] != payload[key] for key in ("fullName", "email", "department")
+                ):
+                    self.conflicts.append(payload["employeeId"])
+            elif response.status_code >= 500:
+                raise RuntimeError(f"Failed to create {payload['fullName']} ({response.status_code}): {response.text}")
+            else:
+                # Rejected record (e.g. invalid email); the rest of the import goes on
+                print(f"\nFailed to create {payload['fullName']}: {response.text}")
+        return created
+
+    async def finish_employees(self) -> None:
+        pass
+
+    async def write_attendance(self, batch: List[Dict]) -> int:
+        records = [{key: record[key] for key in ("employeeId", "date", "status")} for record in batch]
+        response = await self.request("POST", "/api/attendance/bulk", json={"records": records})
+        if response.status_code != 200:
+            raise RuntimeError(f"Bulk attendance request failed ({response.status_code}): {response.text}")
+        return response.json()["created"]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Bulk import employees and attendance")
+    parser.add_argument("--employees", help="Employees file (.csv, .json, .ndjson)")
+    parser.add_argument("--attendance", help="Attendance file (.csv, .json, .ndjson)")
+    parser.add_argument("--synthetic-employees", type=int, default=0,
+                        help="Generate this many employees (with attendance unless --attendance is given)")
+    parser.add_argument("--synthetic-days", type=int, default=365,
+                        help="Days of synthetic attendance up to yesterday (default: 365)")
+    parser.add_argument("--weekends", action="store_true", help="Include weekends in synthetic attendance")
+    parser.add_argument("--http", metavar="URL",
+                        help="Import through the API at URL instead of writing to DATABASE_URL")
+    parser.add_argument("--batch-size", type=int, default=50000,
+                        help="Rows per database batch (default: 50000; HTTP uses the bulk endpoint limit)")
+    parser.add_argument("--concurrency", type=int, default=4,
+                        help="Batches (database) or connections (HTTP) in flight (default: 4)")
+    args = parser.parse_args()
+
+    if not (args.employees or args.attendance or args.synthetic_employees):
+        parser.error("nothing to import: pass --employees, --attendance or --synthetic-employees")
+    if args.employees and args.synthetic_employees:
+        parser.error("--employees and --synthetic-employees cannot be combined")
+    return args
+
+
+async def main():
+    args = parse_args()
+
+    if args.http:
+        target = HttpTarget(args.http, args.concurrency)
+    else:
+        target = DatabaseTarget(args.batch_size)
+
+    async with target:
+        if args.employees or args.synthetic_employees:
+            if args.employees:
+                # Explicit IDs first (then the ID sequence is synced), so generated IDs cannot take them
+                phases = [
+                    ("Employees with IDs", (record for record in read_records(args.employees) if record.get("employeeId"))),
+                    ("Employees without IDs", (record for record in read_records(args.employees) if not record.get("employeeId"))),
+                ]
+            else:
+                phases = [("Employees", synthetic_employees(args.synthetic_employees))]
+            # Employees go one request each over HTTP, so small batches spread them over the connections
+            size = target.batch_size if not args.http else 100
+            for label, records in phases:
+                await run_batches(batched(records, size), target.write_employees, args.concurrency, Progress(label))
+                await target.finish_employees()
+            if target.conflicts:
+                shown = ", ".join(target.conflicts[:20]) + (" ..." if len(target.conflicts) > 20 else "")
+                print(f"{len(target.conflicts):,} employee IDs already belong to a different employee and were not imported: {shown}")
+
+        if args.attendance:
+            records = read_records(args.attendance)
+        elif args.synthetic_employees:
+            records = synthetic_attendance(target.employee_ids, args.synthetic_days, args.weekends)
+        else:
+            records = None
+
+        if records is not None:
+            await run_batches(
+                batched(records, target.batch_size),
+                target.write_attendance,
+                args.concurrency,
+                Progress("Attendance")
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
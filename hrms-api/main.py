@@ -9,15 +9,24 @@ from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
-from app.routes import employees, attendance, dashboard, health
+from app.routes import employees, attendance, dashboard, health, metrics
 from app.database.connection import db
+from app.services.attendance_batcher import attendance_batcher
+from app.services.employee_directory import employee_directory
+from app.middleware.admission import AdmissionControlMiddleware
+from app.middleware.compression import CompressionMiddleware
 from app.middleware.error_handler import ErrorHandlerMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.read_your_writes import ReadYourWritesMiddleware
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await db.connect()
+    employee_directory.start()
     print("Application started successfully")
     yield
+    await attendance_batcher.close()
+    await employee_directory.stop()
     await db.disconnect()
     print("Application shutdown")
 
@@ -30,7 +39,11 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(ReadYourWritesMiddleware)
 app.add_middleware(ErrorHandlerMiddleware)
+app.add_middleware(AdmissionControlMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 allowed_origins = os.getenv("ALLOWED_ORIGINS", "http://localhost:5173,http://localhost:3000").split(",")
 
@@ -78,4 +91,5 @@ async def debug_db_host():
 app.include_router(employees.router, prefix="/api")
 app.include_router(attendance.router, prefix="/api")
 app.include_router(dashboard.router, prefix="/api")
-app.include_router(health.router, prefix="/api")
\ No newline at end of file
+app.include_router(health.router, prefix="/api")
+app.include_router(metrics.router, prefix="/api")
\ No newline at end of file
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Rebuild the attendance_summary counters
+
+The counters are kept in sync by database triggers, so this is only needed
+to backfill after applying hrms-db/migrations/002_attendance_summary.sql
+(which already backfills once) or to repair them after manual data fixes.
+
+Usage:
+    python rebuild_attendance_summary.py
+"""
+
+import asyncio
+
+from app.database.connection import db
+from app.services.attendance_service import attendance_service
+
+
+async def main():
+    await db.connect()
+    try:
+        employees = await attendance_service.rebuild_summary()
+        print(f"Rebuilt attendance counters for {employees} employees")
+    finally:
+        await db.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -31,6 +31,7 @@ class HRMSTester:
         })
         self.test_employee_id = "TEST001"  # Fixed test employee ID
         self.test_employee_data = None
+        self.failures = []  # Checks that must fail the run (exit code 1)
 
     def make_request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Dict[str, Any]:
         """Make HTTP request and return response"""
@@ -188,6 +189,129 @@ class HRMSTester:
         print("="*50)
         return self.make_request("DELETE", f"/api/employees/{self.test_employee_id}")
 
+    def get_db_query_totals(self, method: str, route: str) -> Dict[str, float]:
+        """Read the per-request query count sum and request count for a route from /api/metrics"""
+        totals = {"sum": 0.0, "count": 0.0}
+        response = self.session.get(f"{self.base_url}/api/metrics")
+        labels = f'{{method="{method}",route="{route}"}}'
+        for line in response.text.splitlines():
+            for key in totals:
+                if line.startswith(f"hrms_http_request_db_queries_{key}{labels} "):
+                    totals[key] = float(line.split()[-1])
+        return totals
+
+    def test_write_query_counts(self):
+        """Test that creating an employee and marking attendance each take one database query"""
+        print("\n" + "="*50)
+        print("TESTING WRITE QUERY COUNTS")
+        print("="*50)
+
+        from datetime import date, timedelta
+        checks = [
+            ("POST", "/api/employees", {
+                "fullName": "Query Count Test",
+                "email": "query.count@example.com",
+                "department": "Testing"
+            }),
+            ("POST", "/api/attendance", {
+                "employeeId": self.test_employee_id,
+                "date": str(date.today() - timedelta(days=1)),
+                "status": "Absent"
+            }),
+        ]
+
+        created_id = None
+        for method, route, data in checks:
+            before = self.get_db_query_totals(method, route)
+            result = self.make_request(method, route, data)
+            after = self.get_db_query_totals(method, route)
+
+            if route == "/api/employees":
+                created_id = result.get("employeeId")
+
+            requests_seen = after["count"] - before["count"]
+            queries = after["sum"] - before["sum"]
+            status = "OK" if requests_seen == 1 and queries == 1 else "FAILED"
+            print(f"{method} {route}: {queries:g} queries for {requests_seen:g} request(s) - {status}")
+            if status == "FAILED":
+                self.failures.append(f"{method} {route} query count")
+
+        if created_id:
+            self.make_request("DELETE", f"/api/employees/{created_id}")
+
+    def get_db_checkout_totals(self, method: str, route: str) -> Dict[str, float]:
+        """Read the request count and requests with at most one connection checkout for a route"""
+        totals = {"count": 0.0, "single": 0.0}
+        response = self.session.get(f"{self.base_url}/api/metrics")
+        labels = f'method="{method}",route="{route}"'
+        for line in response.text.splitlines():
+            if line.startswith(f"hrms_http_request_db_checkouts_count{{{labels}}} "):
+                totals["count"] = float(line.split()[-1])
+            elif line.startswith(f'hrms_http_request_db_checkouts_bucket{{{labels},le="1"}} '):
+                totals["single"] = float(line.split()[-1])
+        return totals
+
+    def test_single_checkout_per_request(self):
+        """Test that each request checks out at most one database connection"""
+        print("\n" + "="*50)
+        print("TESTING CONNECTION CHECKOUTS PER REQUEST")
+        print("="*50)
+
+        from datetime import date, timedelta
+        new_employee = {
+            "fullName": "Checkout Test",
+            "email": "checkout.test@example.com",
+            "department": "Testing"
+        }
+        created_ids = []
+
+        # Take the next two generated IDs manually, so the generated-ID create below
+        # has to retry past them (which must not check out another connection)
+        probe = self.make_request("POST", "/api/employees", new_employee)
+        if "employeeId" in probe:
+            created_ids.append(probe["employeeId"])
+            number = int(probe["employeeId"][3:])
+            for offset in (1, 2):
+                taken = self.make_request("POST", "/api/employees", {
+                    **new_employee,
+                    "employeeId": f"EMP{number + offset:03d}"
+                })
+                if "employeeId" in taken:
+                    created_ids.append(taken["employeeId"])
+
+        checks = [
+            ("POST", "/api/employees", "/api/employees", new_employee),
+            ("POST", "/api/attendance", "/api/attendance", {
+                "employeeId": self.test_employee_id,
+                "date": str(date.today() - timedelta(days=3)),
+                "status": "Present"
+            }),
+            ("GET", "/api/employees", "/api/employees", None),
+            ("GET", "/api/employees/{employee_id}", f"/api/employees/{self.test_employee_id}", None),
+            ("GET", "/api/attendance/{employee_id}", f"/api/attendance/{self.test_employee_id}", None),
+            ("GET", "/api/dashboard/stats", "/api/dashboard/stats", None),
+            ("POST", "/api/attendance/bulk", "/api/attendance/bulk", {
+                "records": [{
+                    "employeeId": self.test_employee_id,
+                    "date": str(date.today() - timedelta(days=2)),
+                    "status": "Present"
+                }]
+            }),
+        ]
+
+        for method, route, endpoint, data in checks:
+            result = self.make_request(method, endpoint, data)
+            if route == "/api/employees" and method == "POST" and "employeeId" in result:
+                created_ids.append(result["employeeId"])
+            totals = self.get_db_checkout_totals(method, route)
+            status = "OK" if totals["count"] > 0 and totals["single"] == totals["count"] else "FAILED"
+            print(f"{method} {route}: {totals['single']:g} of {totals['count']:g} request(s) with at most one checkout - {status}")
+            if status == "FAILED":
+                self.failures.append(f"{method} {route} connection checkouts")
+
+        for employee_id in created_ids:
+            self.make_request("DELETE", f"/api/employees/{employee_id}")
+
     def run_all_tests(self):
         """Run all tests in sequence"""
         print("Starting HRMS API Tests")
@@ -210,11 +334,20 @@ class HRMSTester:
         self.test_mark_attendance()
         self.test_get_attendance()
 
+        # Test query counts of the write paths
+        self.test_write_query_counts()
+
+        # Test that requests share one connection
+        self.test_single_checkout_per_request()
+
         # Clean up
         self.test_delete_employee()
 
         print("\n" + "="*60)
-        print("All tests completed!")
+        if self.failures:
+            print(f"{len(self.failures)} check(s) FAILED: {', '.join(self.failures)}")
+        else:
+            print("All tests completed!")
         print("="*60)
 
 
@@ -242,6 +375,8 @@ def main():
 
     tester = HRMSTester(base_url)
     tester.run_all_tests()
+    if tester.failures:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
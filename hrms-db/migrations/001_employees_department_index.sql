@@ -0,0 +1,5 @@
+-- Supports department-filtered, keyset-paginated employee listing
+-- (GET /api/employees?department=...&cursor=...)
+
+CREATE INDEX IF NOT EXISTS idx_employees_department_employee_id
+    ON employees(department, employee_id);
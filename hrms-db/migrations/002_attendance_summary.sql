@@ -0,0 +1,78 @@
+-- Materialized per-employee attendance counters
+-- Kept in sync by statement-level triggers on attendance, so every write path
+-- (single mark, bulk upsert, deletes, cascades) updates the counters in the
+-- same transaction. Reading presentCount becomes a primary-key join.
+
+CREATE TABLE IF NOT EXISTS attendance_summary (
+    employee_id VARCHAR(50) PRIMARY KEY,
+    present_count INTEGER NOT NULL DEFAULT 0,
+    absent_count INTEGER NOT NULL DEFAULT 0,
+
+    CONSTRAINT fk_attendance_summary_employee_id
+        FOREIGN KEY (employee_id)
+        REFERENCES employees(employee_id)
+        ON DELETE CASCADE
+);
+
+CREATE OR REPLACE FUNCTION attendance_summary_apply() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE attendance_summary s
+        SET present_count = s.present_count - d.present_count,
+            absent_count = s.absent_count - d.absent_count
+        FROM (
+            SELECT employee_id,
+                   COUNT(*) FILTER (WHERE status = 'Present') AS present_count,
+                   COUNT(*) FILTER (WHERE status = 'Absent') AS absent_count
+            FROM old_rows
+            GROUP BY employee_id
+        ) d
+        WHERE s.employee_id = d.employee_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO attendance_summary (employee_id, present_count, absent_count)
+        SELECT employee_id,
+               COUNT(*) FILTER (WHERE status = 'Present'),
+               COUNT(*) FILTER (WHERE status = 'Absent')
+        FROM new_rows
+        GROUP BY employee_id
+        ORDER BY employee_id
+        ON CONFLICT (employee_id) DO UPDATE
+        SET present_count = attendance_summary.present_count + EXCLUDED.present_count,
+            absent_count = attendance_summary.absent_count + EXCLUDED.absent_count;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_attendance_summary_insert ON attendance;
+CREATE TRIGGER trg_attendance_summary_insert
+    AFTER INSERT ON attendance
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION attendance_summary_apply();
+
+DROP TRIGGER IF EXISTS trg_attendance_summary_update ON attendance;
+CREATE TRIGGER trg_attendance_summary_update
+    AFTER UPDATE ON attendance
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION attendance_summary_apply();
+
+DROP TRIGGER IF EXISTS trg_attendance_summary_delete ON attendance;
+CREATE TRIGGER trg_attendance_summary_delete
+    AFTER DELETE ON attendance
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION attendance_summary_apply();
+
+-- Backfill from existing attendance (same as rebuild_attendance_summary.py)
+BEGIN;
+LOCK TABLE attendance IN SHARE MODE;
+DELETE FROM attendance_summary;
+INSERT INTO attendance_summary (employee_id, present_count, absent_count)
+SELECT employee_id,
+       COUNT(*) FILTER (WHERE status = 'Present'),
+       COUNT(*) FILTER (WHERE status = 'Absent')
+FROM attendance
+GROUP BY employee_id;
+COMMIT;
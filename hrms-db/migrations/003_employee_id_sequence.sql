@@ -0,0 +1,23 @@
+-- Sequence-backed employee ID generation (EMP001, EMP002, ...)
+-- Replaces the MAX(employee_id) scan in the API, which was slow and handed
+-- out the same ID to concurrent creates.
+
+CREATE SEQUENCE IF NOT EXISTS employee_id_seq;
+
+-- Continue after the highest existing EMP<number> ID
+SELECT setval(
+    'employee_id_seq',
+    COALESCE(
+        (SELECT MAX(CAST(SUBSTR(employee_id, 4) AS BIGINT)) FROM employees WHERE employee_id ~ '^EMP[0-9]+$'),
+        0
+    ) + 1,
+    false
+);
+
+CREATE OR REPLACE FUNCTION next_employee_id() RETURNS VARCHAR AS $$
+    SELECT 'EMP' || lpad(n::text, greatest(3, length(n::text)), '0')
+    FROM nextval('employee_id_seq') AS n;
+$$ LANGUAGE sql;
+
+ALTER TABLE employees ALTER COLUMN employee_id SET DEFAULT next_employee_id();
+ALTER SEQUENCE employee_id_seq OWNED BY employees.employee_id;
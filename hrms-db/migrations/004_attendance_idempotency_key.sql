@@ -0,0 +1,4 @@
+-- Idempotency-Key of the request that created each attendance record
+-- (lets POST /api/attendance tell a retried request from a reused key)
+
+ALTER TABLE attendance ADD COLUMN IF NOT EXISTS idempotency_key VARCHAR(255);
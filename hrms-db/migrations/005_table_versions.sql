@@ -0,0 +1,28 @@
+-- Per-table change counters, bumped once per writing statement.
+-- Read endpoints derive their ETag from these, so a conditional GET costs a
+-- primary-key lookup instead of the full query.
+
+CREATE TABLE IF NOT EXISTS table_versions (
+    table_name VARCHAR(63) PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0
+);
+
+INSERT INTO table_versions (table_name) VALUES ('employees'), ('attendance')
+ON CONFLICT (table_name) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION bump_table_version() RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = TG_TABLE_NAME;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_employees_version ON employees;
+CREATE TRIGGER trg_employees_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON employees
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version();
+
+DROP TRIGGER IF EXISTS trg_attendance_version ON attendance;
+CREATE TRIGGER trg_attendance_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON attendance
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version();
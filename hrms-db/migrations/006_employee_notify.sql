@@ -0,0 +1,14 @@
+-- Tells API workers that cached employee directory entries may be stale.
+-- Inserts are not announced: the directory only caches employees that exist.
+
+CREATE OR REPLACE FUNCTION notify_employees_changed() RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('employees_changed', TG_OP);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_employees_notify ON employees;
+CREATE TRIGGER trg_employees_notify
+    AFTER UPDATE OR DELETE OR TRUNCATE ON employees
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_employees_changed();
@@ -0,0 +1,133 @@
+-- Contention-free change counters.
+-- A single table_versions row per table made every attendance write in the
+-- system wait on one row lock until commit. The counter is now split into 16
+-- shards picked by backend PID (read with SUM), statements that change no
+-- rows no longer bump it, and attendance history is versioned per employee
+-- on the attendance_summary row its trigger already locks.
+
+ALTER TABLE table_versions ADD COLUMN IF NOT EXISTS shard SMALLINT NOT NULL DEFAULT 0;
+ALTER TABLE table_versions DROP CONSTRAINT IF EXISTS table_versions_pkey;
+ALTER TABLE table_versions ADD PRIMARY KEY (table_name, shard);
+
+INSERT INTO table_versions (table_name, shard)
+SELECT t.table_name, s.shard
+FROM (VALUES ('employees'), ('attendance')) AS t (table_name)
+CROSS JOIN generate_series(0, 15) AS s (shard)
+ON CONFLICT (table_name, shard) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION bump_table_version() RETURNS TRIGGER AS $$
+BEGIN
+    -- Skip statements that changed nothing: an ON CONFLICT DO UPDATE ... WHERE
+    -- that matched no row, or a replayed mark rewriting identical values
+    IF TG_OP = 'INSERT' THEN
+        PERFORM 1 FROM new_rows LIMIT 1;
+    ELSIF TG_OP = 'UPDATE' THEN
+        PERFORM 1 FROM (SELECT * FROM new_rows EXCEPT SELECT * FROM old_rows) changed LIMIT 1;
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM 1 FROM old_rows LIMIT 1;
+    END IF;
+    IF TG_OP <> 'TRUNCATE' AND NOT FOUND THEN
+        RETURN NULL;
+    END IF;
+
+    UPDATE table_versions SET version = version + 1
+    WHERE table_name = TG_TABLE_NAME AND shard = pg_backend_pid() % 16;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Transition tables need one trigger per event
+DROP TRIGGER IF EXISTS trg_employees_version ON employees;
+DROP TRIGGER IF EXISTS trg_employees_version_insert ON employees;
+CREATE TRIGGER trg_employees_version_insert
+    AFTER INSERT ON employees
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version();
+
+DROP TRIGGER IF EXISTS trg_employees_version_update ON employees;
+CREATE TRIGGER trg_employees_version_update
+    AFTER UPDATE ON employees
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version();
+
+DROP TRIGGER IF EXISTS trg_employees_version_delete ON employees;
+CREATE TRIGGER trg_employees_version_delete
+    AFTER DELETE ON employees
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version();
+
+DROP TRIGGER IF EXISTS trg_employees_version_truncate ON employees;
+CREATE TRIGGER trg_employees_version_truncate
+    AFTER TRUNCATE ON employees
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version();
+
+DROP TRIGGER IF EXISTS trg_attendance_version ON attendance;
+DROP TRIGGER IF EXISTS trg_attendance_version_insert ON attendance;
+CREATE TRIGGER trg_attendance_version_insert
+    AFTER INSERT ON attendance
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version();
+
+DROP TRIGGER IF EXISTS trg_attendance_version_update ON attendance;
+CREATE TRIGGER trg_attendance_version_update
+    AFTER UPDATE ON attendance
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version();
+
+DROP TRIGGER IF EXISTS trg_attendance_version_delete ON attendance;
+CREATE TRIGGER trg_attendance_version_delete
+    AFTER DELETE ON attendance
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version();
+
+DROP TRIGGER IF EXISTS trg_attendance_version_truncate ON attendance;
+CREATE TRIGGER trg_attendance_version_truncate
+    AFTER TRUNCATE ON attendance
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version();
+
+-- Per-employee attendance version, bumped with the counters
+ALTER TABLE attendance_summary ADD COLUMN IF NOT EXISTS version BIGINT NOT NULL DEFAULT 0;
+
+CREATE OR REPLACE FUNCTION attendance_summary_apply() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' THEN
+        -- A replayed mark rewrites identical values; leave the version alone
+        PERFORM 1 FROM (SELECT * FROM new_rows EXCEPT SELECT * FROM old_rows) changed LIMIT 1;
+        IF NOT FOUND THEN
+            RETURN NULL;
+        END IF;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE attendance_summary s
+        SET present_count = s.present_count - d.present_count,
+            absent_count = s.absent_count - d.absent_count,
+            version = s.version + 1
+        FROM (
+            SELECT employee_id,
+                   COUNT(*) FILTER (WHERE status = 'Present') AS present_count,
+                   COUNT(*) FILTER (WHERE status = 'Absent') AS absent_count
+            FROM old_rows
+            GROUP BY employee_id
+        ) d
+        WHERE s.employee_id = d.employee_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO attendance_summary (employee_id, present_count, absent_count, version)
+        SELECT employee_id,
+               COUNT(*) FILTER (WHERE status = 'Present'),
+               COUNT(*) FILTER (WHERE status = 'Absent'),
+               1
+        FROM new_rows
+        GROUP BY employee_id
+        ORDER BY employee_id
+        ON CONFLICT (employee_id) DO UPDATE
+        SET present_count = attendance_summary.present_count + EXCLUDED.present_count,
+            absent_count = attendance_summary.absent_count + EXCLUDED.absent_count,
+            version = attendance_summary.version + 1;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,16 @@
+-- One attendance record per Idempotency-Key
+-- (lets POST /api/attendance reject a key reused for a different employee or date)
+
+-- Keys stored twice before this migration stay on the earliest record only
+UPDATE attendance a
+SET idempotency_key = NULL
+WHERE a.idempotency_key IS NOT NULL
+  AND EXISTS (
+      SELECT 1 FROM attendance b
+      WHERE b.idempotency_key = a.idempotency_key
+        AND (b.created_at, b.id) < (a.created_at, a.id)
+  );
+
+CREATE UNIQUE INDEX IF NOT EXISTS uix_attendance_idempotency_key
+    ON attendance(idempotency_key)
+    WHERE idempotency_key IS NOT NULL;
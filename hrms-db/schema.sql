@@ -7,16 +7,26 @@ CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 -- Attendance status enum
 CREATE TYPE attendance_status AS ENUM ('Present', 'Absent');
 
+-- Employee ID generator (EMP001, EMP002, ...)
+CREATE SEQUENCE employee_id_seq;
+
+CREATE OR REPLACE FUNCTION next_employee_id() RETURNS VARCHAR AS $$
+    SELECT 'EMP' || lpad(n::text, greatest(3, length(n::text)), '0')
+    FROM nextval('employee_id_seq') AS n;
+$$ LANGUAGE sql;
+
 -- Employees table
 CREATE TABLE employees (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
-    employee_id VARCHAR(50) UNIQUE NOT NULL,
+    employee_id VARCHAR(50) UNIQUE NOT NULL DEFAULT next_employee_id(),
     full_name VARCHAR(200) NOT NULL,
     email VARCHAR(200) NOT NULL,
     department VARCHAR(100) NOT NULL,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
 
+ALTER SEQUENCE employee_id_seq OWNED BY employees.employee_id;
+
 -- Attendance table
 CREATE TABLE attendance (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
@@ -24,6 +34,7 @@ CREATE TABLE attendance (
     date DATE NOT NULL,
     status attendance_status NOT NULL,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    idempotency_key VARCHAR(255),
 
     -- Foreign key constraint
     CONSTRAINT fk_attendance_employee_id
@@ -37,6 +48,171 @@ CREATE TABLE attendance (
 
 -- Create indexes for better query performance
 CREATE INDEX idx_employees_employee_id ON employees(employee_id);
+CREATE INDEX idx_employees_department_employee_id ON employees(department, employee_id);
 CREATE INDEX idx_attendance_employee_id ON attendance(employee_id);
 CREATE INDEX idx_attendance_date ON attendance(date);
 CREATE INDEX idx_attendance_employee_date ON attendance(employee_id, date);
+CREATE UNIQUE INDEX uix_attendance_idempotency_key ON attendance(idempotency_key) WHERE idempotency_key IS NOT NULL;
+
+-- Per-employee attendance counters, maintained by triggers on attendance
+CREATE TABLE attendance_summary (
+    employee_id VARCHAR(50) PRIMARY KEY,
+    present_count INTEGER NOT NULL DEFAULT 0,
+    absent_count INTEGER NOT NULL DEFAULT 0,
+    -- Bumped on every change to the employee's attendance (history ETags)
+    version BIGINT NOT NULL DEFAULT 0,
+
+    CONSTRAINT fk_attendance_summary_employee_id
+        FOREIGN KEY (employee_id)
+        REFERENCES employees(employee_id)
+        ON DELETE CASCADE
+);
+
+CREATE OR REPLACE FUNCTION attendance_summary_apply() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' THEN
+        -- A replayed mark rewrites identical values; leave the version alone
+        PERFORM 1 FROM (SELECT * FROM new_rows EXCEPT SELECT * FROM old_rows) changed LIMIT 1;
+        IF NOT FOUND THEN
+            RETURN NULL;
+        END IF;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE attendance_summary s
+        SET present_count = s.present_count - d.present_count,
+            absent_count = s.absent_count - d.absent_count,
+            version = s.version + 1
+        FROM (
+            SELECT employee_id,
+                   COUNT(*) FILTER (WHERE status = 'Present') AS present_count,
+                   COUNT(*) FILTER (WHERE status = 'Absent') AS absent_count
+            FROM old_rows
+            GROUP BY employee_id
+        ) d
+        WHERE s.employee_id = d.employee_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO attendance_summary (employee_id, present_count, absent_count, version)
+        SELECT employee_id,
+               COUNT(*) FILTER (WHERE status = 'Present'),
+               COUNT(*) FILTER (WHERE status = 'Absent'),
+               1
+        FROM new_rows
+        GROUP BY employee_id
+        ORDER BY employee_id
+        ON CONFLICT (employee_id) DO UPDATE
+        SET present_count = attendance_summary.present_count + EXCLUDED.present_count,
+            absent_count = attendance_summary.absent_count + EXCLUDED.absent_count,
+            version = attendance_summary.version + 1;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_attendance_summary_insert
+    AFTER INSERT ON attendance
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION attendance_summary_apply();
+
+CREATE TRIGGER trg_attendance_summary_update
+    AFTER UPDATE ON attendance
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION attendance_summary_apply();
+
+CREATE TRIGGER trg_attendance_summary_delete
+    AFTER DELETE ON attendance
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION attendance_summary_apply();
+
+-- Per-table change counters, bumped once per statement that changes rows.
+-- Read endpoints derive their ETag from these, so a conditional GET costs a
+-- primary-key lookup instead of the full query. Each table has 16 shards,
+-- picked by backend PID and read with SUM, so concurrent writers do not
+-- queue on one row lock.
+CREATE TABLE table_versions (
+    table_name VARCHAR(63) NOT NULL,
+    shard SMALLINT NOT NULL DEFAULT 0,
+    version BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (table_name, shard)
+);
+
+INSERT INTO table_versions (table_name, shard)
+SELECT t.table_name, s.shard
+FROM (VALUES ('employees'), ('attendance')) AS t (table_name)
+CROSS JOIN generate_series(0, 15) AS s (shard);
+
+CREATE OR REPLACE FUNCTION bump_table_version() RETURNS TRIGGER AS $$
+BEGIN
+    -- Skip statements that changed nothing: an ON CONFLICT DO UPDATE ... WHERE
+    -- that matched no row, or a replayed mark rewriting identical values
+    IF TG_OP = 'INSERT' THEN
+        PERFORM 1 FROM new_rows LIMIT 1;
+    ELSIF TG_OP = 'UPDATE' THEN
+        PERFORM 1 FROM (SELECT * FROM new_rows EXCEPT SELECT * FROM old_rows) changed LIMIT 1;
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM 1 FROM old_rows LIMIT 1;
+    END IF;
+    IF TG_OP <> 'TRUNCATE' AND NOT FOUND THEN
+        RETURN NULL;
+    END IF;
+
+    UPDATE table_versions SET version = version + 1
+    WHERE table_name = TG_TABLE_NAME AND shard = pg_backend_pid() % 16;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Transition tables need one trigger per event
+CREATE TRIGGER trg_employees_version_insert
+    AFTER INSERT ON employees
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version();
+
+CREATE TRIGGER trg_employees_version_update
+    AFTER UPDATE ON employees
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version();
+
+CREATE TRIGGER trg_employees_version_delete
+    AFTER DELETE ON employees
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version();
+
+CREATE TRIGGER trg_employees_version_truncate
+    AFTER TRUNCATE ON employees
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version();
+
+CREATE TRIGGER trg_attendance_version_insert
+    AFTER INSERT ON attendance
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version();
+
+CREATE TRIGGER trg_attendance_version_update
+    AFTER UPDATE ON attendance
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version();
+
+CREATE TRIGGER trg_attendance_version_delete
+    AFTER DELETE ON attendance
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version();
+
+CREATE TRIGGER trg_attendance_version_truncate
+    AFTER TRUNCATE ON attendance
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version();
+
+-- Tells API workers that cached employee directory entries may be stale.
+-- Inserts are not announced: the directory only caches employees that exist.
+CREATE OR REPLACE FUNCTION notify_employees_changed() RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('employees_changed', TG_OP);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_employees_notify
+    AFTER UPDATE OR DELETE OR TRUNCATE ON employees
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_employees_changed();
@@ -5,7 +5,7 @@ import { Badge } from '../components/common/Badge';
 import { Loading } from '../components/common/Loading';
 import { employeeService } from '../services/employeeService';
 import { attendanceService } from '../services/attendanceService';
-import { type Employee } from '../types/employee';
+import { type EmployeeOption } from '../types/employee';
 import { type Attendance as AttendanceRecord, type AttendanceCreate } from '../types/attendance';
 import { useToast } from '../context/ToastContext';
 import { ErrorMessage } from '../components/common/ErrorMessage';
@@ -13,7 +13,7 @@ import { Calendar, User, CheckCircle2, XCircle } from 'lucide-react';
 
 export const Attendance: React.FC = () => {
     const { showToast } = useToast();
-    const [employees, setEmployees] = useState<Employee[]>([]);
+    const [employees, setEmployees] = useState<EmployeeOption[]>([]);
     const [selectedEmployee, setSelectedEmployee] = useState<string>('');
     const [attendanceHistory, setAttendanceHistory] = useState<AttendanceRecord[]>([]);
     const [loadingEmployees, setLoadingEmployees] = useState(true);
@@ -45,7 +45,7 @@ export const Attendance: React.FC = () => {
         try {
             setLoadingEmployees(true);
             setErrorEmployees(null);
-            const data = await employeeService.getAllEmployees();
+            const data = await employeeService.getEmployeeOptions();
             setEmployees(Array.isArray(data) ? data : []);
         } catch (err) {
             setErrorEmployees('Failed to load employees');
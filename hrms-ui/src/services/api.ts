@@ -17,6 +17,8 @@ export const api: AxiosInstance = axios.create({
     headers: {
         'Content-Type': 'application/json',
     },
+    // Sends the recent-write cookie so reads after a write skip the read replica
+    withCredentials: true,
 });
 
 // Response interceptor for error handling
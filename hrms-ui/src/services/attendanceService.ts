@@ -1,5 +1,5 @@
 import { api } from './api';
-import { type Attendance, type AttendanceCreate, type AttendanceResponse } from '../types/attendance';
+import { type Attendance, type AttendanceCreate, type AttendanceResponse, type AttendancePage } from '../types/attendance';
 
 export const attendanceService = {
     // Mark attendance
@@ -8,9 +8,18 @@ export const attendanceService = {
         return response.data;
     },
 
-    // Get attendance for employee
-    async getAttendanceByEmployee(employeeId: string): Promise<Attendance[]> {
-        const response = await api.get(`/api/attendance/${employeeId}`);
+    // Get one page of attendance for employee (most recent first)
+    async getAttendancePage(
+        employeeId: string,
+        params: { from?: string; to?: string; status?: 'Present' | 'Absent'; limit?: number; cursor?: string } = {}
+    ): Promise<AttendancePage> {
+        const response = await api.get(`/api/attendance/${employeeId}`, { params });
         return response.data;
     },
+
+    // Get recent attendance for employee
+    async getAttendanceByEmployee(employeeId: string): Promise<Attendance[]> {
+        const page = await attendanceService.getAttendancePage(employeeId);
+        return page.items;
+    },
 };
\ No newline at end of file
@@ -1,13 +1,37 @@
 import { api } from './api';
-import { type Employee, type EmployeeCreate, type EmployeeResponse, type EmployeeDeleteResponse } from '../types/employee';
+import { type Employee, type EmployeeCreate, type EmployeeResponse, type EmployeeDeleteResponse, type EmployeePage, type EmployeeOption } from '../types/employee';
 
 export const employeeService = {
-    // Get all employees
-    async getAllEmployees(): Promise<Employee[]> {
-        const response = await api.get('/api/employees');
+    // Get one page of employees
+    async getEmployeePage(params: { limit?: number; cursor?: string; department?: string; name?: string; fields?: string } = {}): Promise<EmployeePage> {
+        const response = await api.get('/api/employees', { params });
         return response.data;
     },
 
+    // Get all employees by following the pagination cursor
+    async getAllEmployees(): Promise<Employee[]> {
+        const employees: Employee[] = [];
+        let cursor: string | undefined;
+        do {
+            const page = await employeeService.getEmployeePage({ limit: 500, cursor });
+            employees.push(...page.items);
+            cursor = page.nextCursor ?? undefined;
+        } while (cursor);
+        return employees;
+    },
+
+    // Get the ID and name of every employee, for dropdowns
+    async getEmployeeOptions(): Promise<EmployeeOption[]> {
+        const employees: EmployeeOption[] = [];
+        let cursor: string | undefined;
+        do {
+            const page = await employeeService.getEmployeePage({ limit: 500, cursor, fields: 'employeeId,fullName' });
+            employees.push(...page.items);
+            cursor = page.nextCursor ?? undefined;
+        } while (cursor);
+        return employees;
+    },
+
     // Get employee by ID
     async getEmployeeById(employeeId: string): Promise<Employee> {
         const response = await api.get(`/api/employees/${employeeId}`);
@@ -12,4 +12,9 @@ export interface AttendanceCreate {
     status: 'Present' | 'Absent';
 }
 
-export interface AttendanceResponse extends Attendance { }
\ No newline at end of file
+export interface AttendanceResponse extends Attendance { }
+
+export interface AttendancePage {
+    items: Attendance[];
+    nextCursor: string | null;
+}
\ No newline at end of file
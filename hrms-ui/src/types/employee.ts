@@ -8,6 +8,8 @@ export interface Employee {
     presentCount?: number;
 }
 
+export type EmployeeOption = Pick<Employee, 'employeeId' | 'fullName'>;
+
 export interface EmployeeCreate {
     employeeId?: string;
     fullName: string;
@@ -17,6 +19,11 @@ export interface EmployeeCreate {
 
 export interface EmployeeResponse extends Employee { }
 
+export interface EmployeePage {
+    items: Employee[];
+    nextCursor: string | null;
+}
+
 export interface EmployeeDeleteResponse {
     message: string;
     employeeId: string;